@@ -4,6 +4,7 @@ Dp vs. Divide-and-Conquer
 Recursion vs. Iterative
 """
 import random
+from bisect import bisect_left, bisect_right
 
 def largest_value(A):
     """Find largest value in a list using a for loop."""
@@ -25,7 +26,7 @@ def largest_value_rec(A):
         
         mid = (lo + hi) // 2
          
-        L = large(0, mid)
+        L = large(lo, mid)
         R = large(mid+1, hi)
          
         return max(L, R)
@@ -181,15 +182,105 @@ def lis_with_solution(A):
     result.reverse()
     return (m, result)
 
+def lis_patience(A, strict=True, key=None):
+    """
+    Patience sorting approach for LIS in O(N log N) that also computes sequence itself. tails[k] is the smallest
+    value that ends an increasing subsequence of length k+1 found so far, so tails is sorted and each value can be
+    placed with a binary search. If strict is False, find longest non-decreasing subsequence instead. If key is
+    given, values are compared by key(value), as with sorted().
+    """
+    place = bisect_left if strict else bisect_right
+    tails = []          # Smallest key that ends increasing subsequence of length k+1
+    tails_idx = []      #   and the position in A of that value
+    prev = []           # Position of value that comes before A[i] in subsequence ending at A[i]
+    
+    for i, v in enumerate(A):
+        k = v if key is None else key(v)
+        pos = place(tails, k)
+        prev.append(tails_idx[pos-1] if pos > 0 else -1)
+        if pos == len(tails):
+            tails.append(k)
+            tails_idx.append(i)
+        else:
+            tails[pos] = k
+            tails_idx[pos] = i
+    
+    result = []
+    i = tails_idx[-1] if tails_idx else -1
+    while i != -1:
+        result.append(A[i])
+        i = prev[i]
+    result.reverse()
+    return (len(tails), result)
+
+class OnlineLIS:
+    """
+    Longest increasing subsequence of values that arrive one at a time, such as from an endless stream, using
+    the same tails as lis_patience() but without storing the values. Memory is proportional to the length of
+    the LIS. If track is True, subsequence() returns the LIS itself: each tail then keeps a node (value, node
+    before it), and nodes no longer reachable from any tail are freed by Python.
+    """
+    def __init__(self, strict=True, key=None, track=False):
+        self.place = bisect_left if strict else bisect_right
+        self.key = key
+        self.track = track
+        self.tails = []          # Smallest key that ends increasing subsequence of length k+1
+        self.nodes = []          # When tracking, (value, previous node) for the value of each tail
+        self.count = 0           # Number of values added
+
+    def add(self, v):
+        """Add the next value and return the length of the LIS so far."""
+        k = v if self.key is None else self.key(v)
+        pos = self.place(self.tails, k)
+        if pos == len(self.tails):
+            self.tails.append(k)
+            if self.track:
+                self.nodes.append(None)
+        else:
+            self.tails[pos] = k
+        if self.track:
+            self.nodes[pos] = (v, self.nodes[pos-1] if pos > 0 else None)
+        self.count += 1
+        return len(self.tails)
+
+    def extend(self, values):
+        """Add each of the values in turn and return the length of the LIS so far."""
+        for v in values:
+            self.add(v)
+        return len(self.tails)
+
+    def __len__(self):
+        return len(self.tails)
+
+    def subsequence(self):
+        """Return a longest increasing subsequence of the values added so far (requires track=True)."""
+        if not self.track:
+            raise ValueError('subsequence() requires OnlineLIS(track=True)')
+        result = []
+        node = self.nodes[-1] if self.nodes else None
+        while node is not None:
+            result.append(node[0])
+            node = node[1]
+        result.reverse()
+        return result
+
 def timing_lis_trial():
-    """Timing lis on random lists of size N."""
+    """Timing lis and lis_patience on random lists of size N, continuing with lis_patience alone for larger N."""
     import timeit
     
     for k in range(6, 12):
         N = 2 ** k
         result = timeit.timeit(f'lis(shuffled(R))', setup=f'R=list(range({N}))', globals = globals(), number=100)
         result /= 100
-        print('lis', N, result)
+        fast = timeit.timeit(f'lis_patience(shuffled(R))', setup=f'R=list(range({N}))', globals = globals(), number=100)
+        fast /= 100
+        print('lis', N, result, 'lis_patience', fast)
+        
+    for k in range(12, 21, 2):
+        N = 2 ** k
+        fast = timeit.timeit(f'lis_patience(shuffled(R))', setup=f'R=list(range({N}))', globals = globals(), number=5)
+        fast /= 5
+        print('lis_patience', N, fast)
 
 def timing_lis_rec_trial():
     """Timing lis_rec on random lists of size N."""
@@ -252,12 +343,18 @@ if __name__ == "__main__":
         len2 = lis_rec(R)
         len3 = lis_rec_memo(R)
         (len4,sol4) = lis_with_solution(R)
+        (len5,sol5) = lis_patience(R)
         results = set()
         results.add(len1)
         results.add(len2)
         results.add(len3)
         results.add(len4)
-        if len(results) != 1:
+        results.add(len5)
+        online = OnlineLIS(track=True)
+        online.extend(R)
+        if len(results) != 1 or len(sol5) != len5 or any(a >= b for a,b in zip(sol5, sol5[1:])):
+            print("BAD")
+        if len(online) != len5 or online.subsequence() != sol5:
             print("BAD")
 
     print ("DONE")
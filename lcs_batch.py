@@ -0,0 +1,134 @@
+"""
+Score one query against a large batch of candidates by the length of their Longest Common Subsequence (LCS),
+and report the best ones.
+
+The match masks for the query (see lcs_bits() in longest_subsequence.py) are computed only once (once per
+worker process when using a pool) and each candidate is then scored bit-parallel, one row of the table for
+each of its symbols. Scoring a candidate stops early:
+
+    * once the LCS found so far, plus the number of symbols of the candidate not yet seen, can no longer reach
+      the threshold (or beat the k-th best score so far), since each symbol adds at most one; or
+    * once the LCS is the entire query, since it cannot get any longer.
+
+For example, to find the 5 candidates with the longest LCS of at least 10:
+
+    lcs_top_k(query, candidates, k=5, threshold=10, workers=4)
+"""
+import heapq
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from longest_subsequence import match_masks, popcount
+
+CHECK = 32                 # symbols scored between checks for early termination
+CHUNK = 1000               # candidates sent to a worker at a time
+
+def score(masks, n, candidate, threshold=0):
+    """
+    Return length of LCS of candidate with query of length n whose match masks are given, or None if it is
+    smaller than threshold.
+    """
+    remaining = len(candidate)
+    if min(n, remaining) < threshold:
+        return None
+
+    full = (1 << n) - 1
+    V = full
+    for (i, b) in enumerate(candidate, 1):
+        U = V & masks.get(b, 0)
+        V = ((V + U) | (V - U)) & full
+        if i % CHECK == 0:
+            found = n - popcount(V)
+            if found + remaining - i < threshold:
+                return None
+            if found == n:
+                return n
+    found = n - popcount(V)
+    return found if found >= threshold else None
+
+def top_k(masks, n, candidates, offset, k, threshold):
+    """Return best k (or all, if k is None) as (position, score) for candidates starting at position offset."""
+    best = []                  # Min heap of (score, -position), so worst of the best is best[0]
+    for (idx, candidate) in enumerate(candidates, offset):
+        if k is not None and len(best) == k:
+            threshold = max(threshold, best[0][0] + 1)      # must beat k-th best; earlier positions win ties
+        s = score(masks, n, candidate, threshold)
+        if s is None:
+            continue
+        if k is not None and len(best) == k:
+            heapq.heapreplace(best, (s, -idx))
+        else:
+            heapq.heappush(best, (s, -idx))
+    return [(-neg_idx, s) for (s, neg_idx) in best]
+
+# Match masks of the query in each worker process, computed once by init_worker
+worker_query = None
+
+def init_worker(query):
+    global worker_query
+    worker_query = (match_masks(query), len(query))
+
+def top_k_worker(candidates, offset, k, threshold):
+    """Worker: top_k() for a chunk of candidates, using the query given to init_worker()."""
+    (masks, n) = worker_query
+    return top_k(masks, n, candidates, offset, k, threshold)
+
+def lcs_top_k(query, candidates, k=10, threshold=0, workers=None, chunk=CHUNK):
+    """
+    Return the k candidates (or all of them, if k is None) whose LCS with query is longest and at least
+    threshold, as a list of (position in candidates, LCS length) from longest to shortest; candidates with the
+    same length are listed in order. If workers is given, candidates are scored by that many processes.
+    """
+    if k is not None and k < 0:
+        raise ValueError(f'k must not be negative, not {k}')
+    if k == 0:
+        return []
+    if workers is None:
+        results = top_k(match_masks(query), len(query), candidates, 0, k, threshold)
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(query,)) as pool:
+            futures = [pool.submit(top_k_worker, candidates[lo:lo+chunk], lo, k, threshold)
+                       for lo in range(0, len(candidates), chunk)]
+            for future in futures:
+                results.extend(future.result())
+
+    results.sort(key=lambda pair: (-pair[1], pair[0]))
+    return results if k is None else results[:k]
+
+def timing_trial(num=20000, size=200):
+    """Compare scoring each candidate with lcs_bits() against lcs_top_k() on random DNA strings."""
+    import timeit
+    from longest_subsequence import lcs_bits
+
+    query = ''.join(random.choice('ACGT') for _ in range(size))
+    candidates = [''.join(random.choice('ACGT') for _ in range(random.randint(size//2, size)))
+                  for _ in range(num)]
+
+    each = timeit.timeit(lambda: sorted(((lcs_bits(query, c), i) for (i, c) in enumerate(candidates)),
+                                        key=lambda p: (-p[0], p[1]))[:10], number=1)
+    print('lcs_bits for each', num, f'{each:.3f}')
+    batch = timeit.timeit(lambda: lcs_top_k(query, candidates, k=10), number=1)
+    print('lcs_top_k', num, f'{batch:.3f}')
+    batch = timeit.timeit(lambda: lcs_top_k(query, candidates, k=10, workers=2), number=1)
+    print('lcs_top_k with 2 workers', num, f'{batch:.3f}')
+
+if __name__ == '__main__':
+    from longest_subsequence import lcs_bits
+
+    print('Compare lcs_top_k against lcs_bits')
+    for _ in range(200):
+        query = ''.join(random.choice('abc') for _ in range(random.randint(0, 80)))
+        candidates = [''.join(random.choice('abcd') for _ in range(random.randint(0, 80))) for _ in range(50)]
+        k = random.choice([None, 0, 1, 5])
+        threshold = random.randint(0, 30)
+        expected = sorted(((i, lcs_bits(query, c)) for (i, c) in enumerate(candidates)), key=lambda p: (-p[1], p[0]))
+        expected = [p for p in expected if p[1] >= threshold]
+        expected = expected if k is None else expected[:k]
+        if lcs_top_k(query, candidates, k, threshold) != expected:
+            print('BAD', query, candidates, k, threshold)
+        if lcs_top_k(query, candidates, k, threshold, workers=2, chunk=7) != expected:
+            print('BAD with workers', query, candidates, k, threshold)
+    print('DONE')
+
+    timing_trial()
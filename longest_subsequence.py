@@ -7,8 +7,19 @@ but it is easier to explain this way.
 lcs_optimized provides a recursive implementation using the index values of si and ti to refer to the prefix within
 si and ti. It also uses memoization to avoid redoing past problems AND it returns the actual subsequence, not just 
 the length of the longest common subsequence.
+
+For long sequences (of any type, not just strings), lcs_length computes the length using only two rows of the
+table at a time, and lcs_hirschberg recovers the subsequence itself in linear space using Hirschberg's
+divide-and-conquer approach.
+
+lcs_bits computes the length bit-parallel (Allison-Dix / Hyyro): one Python integer holds a whole row of the
+table, stored as the bits where the row increases, and each symbol of t updates the entire row with a handful
+of integer operations on match masks precomputed for each symbol of s. lcs_hirschberg uses the same approach to
+compute its rows. Both require the elements of the sequences to be hashable.
 """
 
+popcount = getattr(int, 'bit_count', lambda x: bin(x).count('1'))
+
 def lcs(s, t):
     if len(s) == 0 or len(t) == 0:
         return 0
@@ -74,6 +85,111 @@ def lcs_tabulate(s, t):
     print (LCS)
     return LCS[sN][tN]
 
+def lcs_row(s, t):
+    """Return row whose value at j is the length of LCS of s with t[:j], keeping only two rows of the table."""
+    prev = [0] * (len(t)+1)
+    for a in s:
+        row = [0] * (len(t)+1)
+        left = 0
+        for ti, b in enumerate(t):
+            if a == b:
+                left = prev[ti] + 1
+            elif prev[ti+1] > left:
+                left = prev[ti+1]
+            row[ti+1] = left
+        prev = row
+    return prev
+
+def match_masks(s):
+    """Return dictionary whose value for each symbol has bit i set wherever s[i] is that symbol."""
+    masks = {}
+    for si, a in enumerate(s):
+        masks[a] = masks.get(a, 0) | (1 << si)
+    return masks
+
+def lcs_bits_row(s, t, masks=None):
+    """
+    Same as lcs_row(s, t) but bit-parallel. Bit i of V is 0 exactly when the LCS of s[:i+1] with the part of t
+    seen so far is longer than that of s[:i], so the LCS with all of s is the number of 0 bits.
+    """
+    if masks is None:
+        masks = match_masks(s)
+    n = len(s)
+    full = (1 << n) - 1
+    V = full
+    row = [0]
+    for b in t:
+        U = V & masks.get(b, 0)
+        V = ((V + U) | (V - U)) & full
+        row.append(n - popcount(V))
+    return row
+
+def lcs_bits(s, t, masks=None):
+    """
+    Length of LCS of two sequences, updating a whole row of the table with each symbol of t. masks, if given, must
+    be match_masks(s), so it can be reused for many t.
+    """
+    if masks is None:
+        if len(t) > len(s):            # fewer, longer integer operations are faster
+            s, t = t, s
+        masks = match_masks(s)
+    n = len(s)
+    full = (1 << n) - 1
+    V = full
+    for b in t:
+        U = V & masks.get(b, 0)
+        V = ((V + U) | (V - U)) & full
+    return n - popcount(V)
+
+def common_ends(s, t):
+    """Return (length of common prefix, length of common suffix) of s and t, which do not overlap."""
+    n = min(len(s), len(t))
+    lo = 0
+    while lo < n and s[lo] == t[lo]:
+        lo += 1
+    hi = 0
+    while hi < n - lo and s[-1-hi] == t[-1-hi]:
+        hi += 1
+    return (lo, hi)
+
+def lcs_length(s, t):
+    """Length of LCS of two sequences, using memory proportional to the shorter one."""
+    (lo, hi) = common_ends(s, t)
+    s, t = s[lo:len(s)-hi], t[lo:len(t)-hi]
+    if len(t) > len(s):
+        s, t = t, s
+    return lo + hi + lcs_row(s, t)[-1]
+
+def lcs_hirschberg(s, t):
+    """
+    Return LCS of two sequences (a str when s is a str, otherwise a list) in linear space. s is split in half,
+    and t is split where the LCS of the first half with the start of t, plus the LCS of the second half with
+    the rest of t, is largest; each half then finds its part of the LCS.
+    """
+    result = []
+    
+    def inner(s, t):
+        if len(s) == 0 or len(t) == 0:
+            return
+        if len(s) == 1:
+            if s[0] in t:
+                result.append(s[0])
+            return
+        
+        mid = len(s) // 2
+        left = lcs_bits_row(s[:mid], t)
+        right = lcs_bits_row(s[mid:][::-1], t[::-1])
+        n = len(t)
+        split = max(range(n+1), key=lambda ti: left[ti] + right[n-ti])
+        inner(s[:mid], t[:split])
+        inner(s[mid:], t[split:])
+    
+    (lo, hi) = common_ends(s, t)
+    result.extend(s[:lo])
+    inner(s[lo:len(s)-hi], t[lo:len(t)-hi])
+    result.extend(s[len(s)-hi:])
+    return ''.join(result) if isinstance(s, str) else result
+
 if __name__ == '__main__':
     print(lcs('state', 'stealth'))
     print(lcs_tabulate('state', 'stealth'))
@@ -81,3 +197,6 @@ if __name__ == '__main__':
     print(lcs_tabulate('heart', 'hat'))
     print(lcs_optimized('REWARD' , 'DRAWER'))
     print(lcs_optimized('TEAM' , 'META'))
+    
+    print(lcs_length('REWARD', 'DRAWER'), lcs_bits('REWARD', 'DRAWER'), lcs_hirschberg('REWARD', 'DRAWER'))
+    print(lcs_hirschberg([3, 1, 4, 1, 5, 9, 2, 6], [2, 7, 1, 8, 2, 8, 1, 8, 2, 8, 4, 5, 9]))
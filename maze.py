@@ -1,4 +1,11 @@
 import random
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
 from collections import deque
 
 """
@@ -11,42 +18,138 @@ textual, showing the distance computed from the entrance of the maze.
 Represents a rectangular maze whose entrance is in the middle of the top row and whose exit is in the middle
 of the bottom row. You can rapidly construct some random graphs by calling 'random(density)' where higher values
 of density means more walls and a lower likelihood of finding a path in the maze.
+
+The squares are stored in 'grid', a flat bytearray in row-major order using one byte per square (1 is a wall),
+so square (r, c) is found at grid[r*nc + c]. For convenience 'M' offers each row as a read-only memoryview over
+that same storage, so M[r][c] reads the grid without making a copy. An existing writable buffer of nr*nc bytes
+(such as a memory-mapped file) can be provided as grid, in which case the maze uses it directly.
+
+Change walls with setWall() once a maze is being searched: it increments 'version', which lets results cached
+for the maze (such as maze_search.distance_field()) detect the change, and calls each function in 'listeners'
+with the changed square. Writing to grid directly does neither.
 """
 class Maze:
-    def __init__(self, num_rows, num_columns):
+    def __init__(self, num_rows, num_columns, grid=None):
         self.nr = num_rows
         self.nc = num_columns
-        self.M = [None] * num_rows
-        for i in range(num_rows):
-            self.M[i] = [0] * num_columns
+        if grid is None:
+            grid = bytearray(num_rows * num_columns)
+        elif len(grid) != num_rows * num_columns:
+            raise ValueError(f'grid has {len(grid)} squares but maze needs {num_rows * num_columns}')
+        self.grid = grid
+        view = memoryview(self.grid).toreadonly()
+        self.M = [view[r*num_columns:(r+1)*num_columns] for r in range(num_rows)]
+        self.entrance = (0, num_columns//2)
+        self.exit = (num_rows-1, num_columns//2)
+        self.version = 0
+        self.listeners = []
+    
+    def __getstate__(self):
+        """Pickle (or copy) the walls as bytes; the row views, listeners and cached results are not kept."""
+        return {'nr': self.nr, 'nc': self.nc, 'grid': bytes(self.grid), 'entrance': self.entrance,
+                'exit': self.exit, 'version': self.version}
+    
+    def __setstate__(self, state):
+        self.__init__(state['nr'], state['nc'], bytearray(state['grid']))
+        self.entrance = state['entrance']
+        self.exit = state['exit']
+        self.version = state['version']
         
     def random(self, density = .2):
         """Create a random NxN maze with entrance at mid-top and exit at mid-bottom."""
             
         # walls outside
         for i in range (self.nr):
-            self.M[i][0] = 1
-            self.M[i][self.nc-1] = 1
+            self.grid[i*self.nc] = 1
+            self.grid[i*self.nc + self.nc-1] = 1
         for i in range (self.nc):
-            self.M[0][i] = 1
-            self.M[self.nr-1][i] = 1
+            self.grid[i] = 1
+            self.grid[(self.nr-1)*self.nc + i] = 1
         
-        self.M[0][self.nc//2] = 0
-        self.M[self.nr-1][self.nc//2] = 0
+        self.grid[self.nc//2] = 0
+        self.grid[(self.nr-1)*self.nc + self.nc//2] = 0
         
         for r in range(1, self.nr-1):
+            base = r * self.nc
             for c in range(1, self.nc-1):
                 if random.random() < density:
-                    self.M[r][c] = 1
+                    self.grid[base + c] = 1
+        self.version += 1
+
+    def setWall(self, sq, wall=True):
+        """Place (or, if wall is False, remove) a wall at the given square."""
+        self.grid[sq.row * self.nc + sq.column] = 1 if wall else 0
+        self.version += 1
+        for listener in self.listeners:
+            listener(sq)
+
+    def random_fast(self, density = .2, seed = None, solvable = False):
+        """
+        Fill maze with random walls like random(), but an entire row at a time: a random byte is drawn for every
+        square, and translated to a wall when below density * 256 (so density is rounded to a multiple of 1/256).
+        The same seed always produces the same maze. If solvable is True, a random path from entrance to exit
+        is cleared of walls afterwards, so the maze always has a solution.
+        """
+        rng = random.Random(seed)
+        threshold = round(density * 256)
+        table = bytes(1 if ch < threshold else 0 for ch in range(256))
+        nr, nc = self.nr, self.nc
+        
+        # walls outside
+        self.grid[0:nc] = b'\x01' * nc
+        self.grid[(nr-1)*nc:nr*nc] = b'\x01' * nc
+        if nc > 2:
+            for r in range(1, nr-1):
+                inside = rng.getrandbits(8*(nc-2)).to_bytes(nc-2, 'little').translate(table)
+                self.grid[r*nc:(r+1)*nc] = b'\x01' + inside + b'\x01'
+        else:
+            for r in range(1, nr-1):
+                self.grid[r*nc:(r+1)*nc] = b'\x01' * nc
+        
+        self.grid[self.index(Square(*self.entrance))] = 0
+        self.grid[self.index(Square(*self.exit))] = 0
+        if solvable:
+            self.carve(rng)
+        self.version += 1
+
+    def carve(self, rng):
+        """
+        Clear walls along a random path from the square just inside the entrance to the square just inside the
+        exit. The path moves one row at a time, shifting a few columns left or right on each row.
+        """
+        nr, nc = self.nr, self.nc
+        if nr < 3:
+            return               # entrance and exit are next to each other, with no inside squares
+        if nc < 3:
+            raise ValueError('maze must have at least three columns to have a path inside its walls')
+        
+        def inside(r, c):
+            return (min(max(r, 1), nr-2), min(max(c, 1), nc-2))
+        
+        (r, c) = inside(*self.entrance)
+        (last_r, last_c) = inside(*self.exit)
+        step = 1 if last_r >= r else -1
+        while True:
+            target = last_c if r == last_r else min(max(c + rng.randint(-2, 2), 1), nc-2)
+            lo, hi = min(c, target), max(c, target)
+            self.grid[r*nc + lo:r*nc + hi + 1] = bytes(hi - lo + 1)
+            c = target
+            if r == last_r:
+                break
+            r += step
+
+    def index(self, sq):
+        """Position of square within the row-major grid."""
+        return sq.row * self.nc + sq.column
 
     def isWall(self, sq):
-        return self.M[sq.row][sq.column] == 1
+        return self.grid[sq.row * self.nc + sq.column] == 1
 
     def start(self):
-        return Square(0, self.nc//2)
+        return Square(*self.entrance)
     
     def end(self):
-        return Square(self.nr-1, self.nc//2)
+        return Square(*self.exit)
     
     def neighbors(self, sq):
         u = sq.up()
@@ -95,7 +198,11 @@ class Square:
     def __hash__(self):
         return hash((self.row, self.column))
 
-def bfs(maze):
+def bfs(maze, stats=None, trace=None):
+    """
+    If stats dictionary is provided, stats['visited'] records number of squares removed from the queue. If trace
+    is provided (such as a maze_trace.Trace) it records every square added to and removed from the queue.
+    """
     q = deque()
     
     start = maze.start()
@@ -107,9 +214,14 @@ def bfs(maze):
     dist = {}
     marked[start] = True
     dist[start] = 0
+    if trace is not None: trace.discover(start)
+    visited = 0
     while q:
         s = q.popleft()
+        visited += 1
+        if trace is not None: trace.visit(s)
         if s == end:
+            if stats is not None: stats['visited'] = visited
             return (dist, s)
         
         for n in maze.neighbors(s):
@@ -118,10 +230,132 @@ def bfs(maze):
                 dist[n] = dist[s] + 1
                 n.prev = s
                 marked[n] = True
+                if trace is not None: trace.discover(n)
+        
+    if stats is not None: stats['visited'] = visited
+    return (dist, None)
+
+def astar(maze, stats=None):
+    """
+    A* search guided by the Manhattan distance to the end. Returns (dist, end) just like bfs(), but dist only 
+    contains the squares that were reached. If stats dictionary is provided, stats['visited'] records number
+    of squares removed from the priority queue.
+    """
+    start = maze.start()
+    start.prev = None
+    end = maze.end()
+    
+    def estimate(sq):
+        return abs(sq.row - end.row) + abs(sq.column - end.column)
+    
+    # Priority is estimated total length; break ties by preferring squares furthest from start, and then 
+    # by order of insertion, so Squares themselves never need to be compared.
+    pq = [(estimate(start), 0, 0, start)]
+    dist = {start: 0}
+    done = {}                # Squares whose distance is final
+    counter = 1
+    visited = 0
+    while pq:
+        (_, _, _, s) = heapq.heappop(pq)
+        if s in done:
+            continue         # Already removed with a shorter distance
+        done[s] = True
+        visited += 1
+        if s == end:
+            if stats is not None: stats['visited'] = visited
+            return (dist, s)
         
+        for n in maze.neighbors(s):
+            if not maze.isWall(n):
+                d = dist[s] + 1
+                if n not in dist or d < dist[n]:
+                    dist[n] = d
+                    n.prev = s
+                    heapq.heappush(pq, (d + estimate(n), -d, counter, n))
+                    counter += 1
+    
+    if stats is not None: stats['visited'] = visited
     return (dist, None)
+
+def bidirectional_bfs(maze, stats=None):
+    """
+    Breadth-First Search that grows one level at a time from both the start and the end (always the side with
+    the smaller frontier) until the two searches meet. Returns (dist, end) just like bfs(), where dist contains 
+    the distances from start of the squares reached from start, together with all squares on the path. If stats
+    dictionary is provided, stats['visited'] records number of squares removed from either frontier.
+    """
+    start = maze.start()
+    start.prev = None
+    end = maze.end()
+    
+    dist = {start: 0}        # distance from start
+    dist_end = {end: 0}      # distance to end
+    prev = {start: None}     # previous square on the way from start
+    succ = {end: None}       # next square on the way to end
+    front = [start]
+    back = [end]
+    visited = 0
+    
+    if start == end or maze.isWall(end):
+        if stats is not None: stats['visited'] = 1
+        return (dist, start if start == end else None)
+    
+    meet = None
+    while front and back and not meet:
+        forward = len(front) <= len(back)
+        if forward:
+            frontier, mine, other, link = front, dist, dist_end, prev
+        else:
+            frontier, mine, other, link = back, dist_end, dist, succ
+        
+        # Expand an entire level, since the best meeting point is only known once the level is complete
+        best = None
+        level = []
+        for s in frontier:
+            visited += 1
+            for n in maze.neighbors(s):
+                if maze.isWall(n):
+                    continue
+                if n in other:
+                    total = mine[s] + 1 + other[n]
+                    if best is None or total < best:
+                        best = total
+                        meet = (s, n) if forward else (n, s)
+                if n not in mine:
+                    mine[n] = mine[s] + 1
+                    link[n] = s
+                    level.append(n)
+        
+        if forward:
+            front = level
+        else:
+            back = level
+    
+    if stats is not None: stats['visited'] = visited
+    if not meet:
+        return (dist, None)
+    
+    # Recover path: from start to meet[0] using prev, and then from meet[1] to end using succ
+    path = []
+    sq = meet[0]
+    while sq:
+        path.append(sq)
+        sq = prev[sq]
+    path.reverse()
+    sq = meet[1]
+    while sq:
+        path.append(sq)
+        sq = succ[sq]
+    
+    last = None
+    for idx, sq in enumerate(path):
+        sq = Square(sq.row, sq.column)
+        sq.prev = last
+        dist[sq] = idx
+        last = sq
+    return (dist, last)
                 
-def dfs(maze):
+def dfs(maze, trace=None):
     st = deque()             # Stack of Squares to process
     visited = {}             # Squares already visited
     
@@ -131,8 +365,10 @@ def dfs(maze):
     
     st.append(start)         # For every square in the Stack
     visited[start] = True    #   has been visited
+    if trace is not None: trace.discover(start)
     while st:
         s = st.pop()
+        if trace is not None: trace.visit(s)
         if s == end:
             return s
         
@@ -141,10 +377,11 @@ def dfs(maze):
                 st.append(n)
                 n.prev = s   # Remember: came to n from s
                 visited[n] = True
+                if trace is not None: trace.discover(n)
         
     return None                  
                 
-def dfs_distance(maze):
+def dfs_distance(maze, trace=None):
     st = deque()             # Stack of Squares to process
     visited = {}             # Squares already visited
     dist = {}                # Computed distance to visited square
@@ -156,8 +393,10 @@ def dfs_distance(maze):
     st.append(start)         # For every square in the Stack
     visited[start] = True    #   has been visited
     dist[start] = 0          #   Computed distance is known
+    if trace is not None: trace.discover(start)
     while st:
         s = st.pop()
+        if trace is not None: trace.visit(s)
         if s == end:
             return (dist, s)
         
@@ -167,10 +406,11 @@ def dfs_distance(maze):
                 dist[n] = dist[s] + 1
                 n.prev = s   # Remember: came to n from s
                 visited[n] = True
+                if trace is not None: trace.discover(n)
         
     return (dist, None)                
                 
-def dfs_recursive(maze):
+def dfs_recursive(maze, trace=None):
     visited = {}             # Squares already visited
     
     start = maze.start()
@@ -178,8 +418,10 @@ def dfs_recursive(maze):
     end = maze.end()
     
     visited[start] = True    #   has been visited
+    if trace is not None: trace.discover(start)
     
     def dfs(s):
+        if trace is not None: trace.visit(s)
         if s == end:
             return s
         
@@ -187,36 +429,58 @@ def dfs_recursive(maze):
             if n not in visited and not maze.isWall(n):
                 n.prev = s   # Remember: came to n from s
                 visited[n] = True
+                if trace is not None: trace.discover(n)
                 solution = dfs(n)
                 if solution:
                     return solution
         return None
         
     return dfs(start)           
+
+def dfs_iterative(maze, trace=None):
+    """
+    Same search as dfs_recursive(), visiting squares in exactly the same order and producing the same prev links, 
+    but using an explicit stack so deep mazes do not exceed the recursion limit. Each entry in the stack records
+    a square and its remaining neighbors, which is the state the recursive call would have held.
+    """
+    visited = {}             # Squares already visited
+    
+    start = maze.start()
+    start.prev = None        # set 'previous' square for start to None
+    end = maze.end()
+    
+    visited[start] = True    #   has been visited
+    if trace is not None: 
+        trace.discover(start)
+        trace.visit(start)
+    if start == end:
+        return start
+    
+    st = [(start, maze.neighbors(start))]
+    while st:
+        (s, pending) = st[-1]
+        for n in pending:    # resumes with the neighbor after the one last explored
+            if n not in visited and not maze.isWall(n):
+                n.prev = s   # Remember: came to n from s
+                visited[n] = True
+                if trace is not None: 
+                    trace.discover(n)
+                    trace.visit(n)
+                if n == end:
+                    return n
+                st.append((n, maze.neighbors(n)))
+                break
+        else:
+            st.pop()         # all neighbors explored, so return to previous square
+    return None
                 
 def output(maze):
     """Output maze to screen."""
-    for r in range(maze.nr):
-        for c in range(maze.nc):
-            if maze.isWall(Square(r,c)):
-                print('#', end='')
-            else:
-                print(' ', end='')
-        print()
+    write_maze(maze, sys.stdout)
         
 def output_distances(maze, distances):
     """Output path to screen."""
-    for r in range(maze.nr):
-        for c in range(maze.nc):
-            sq = Square(r,c)
-            if maze.isWall(sq):
-                print('#', end=',')
-            else:
-                if sq in distances:
-                    print(distances[sq], end=',')
-                else:
-                    print(0, end=',')
-        print()
+    write_table(maze, distance_table(maze, distances), sys.stdout)
 
 def output_path(end):
     """Output path to screen."""
@@ -230,23 +494,63 @@ def output_path(end):
     print()
 
 def output_solution(maze, end):
-    """Output path to screen."""
+    """Output path to screen, showing position of each square along the path."""
+    write_table(maze, solution_table(maze, end), sys.stdout)
+
+# Translation table for write_maze(): walls become '#' and every other square becomes ' '
+OUTPUT_TABLE = bytes(ord('#') if ch == 1 else ord(' ') for ch in range(256))
+
+def write_maze(maze, out):
+    """Write maze to text file handle, one line per row, '#' for each wall."""
+    for r in range(maze.nr):
+        out.write(bytes(maze.grid[r*maze.nc:(r+1)*maze.nc]).translate(OUTPUT_TABLE).decode() + '\n')
+
+def distance_table(maze, distances):
+    """
+    Return array holding the distance of each square of the maze in row-major order (-1 for squares without one). 
+    Distances can be any mapping from Square to distance, such as computed by bfs(); the arrays behind those 
+    computed by maze_search are copied a row at a time.
+    """
+    table = array('l', [-1]) * (maze.nr * maze.nc)
+    if hasattr(distances, 'grid') and hasattr(distances, 'dist'):
+        W = distances.grid.W
+        for r in range(maze.nr):
+            base = (r+1)*W + 1
+            table[r*maze.nc:(r+1)*maze.nc] = distances.dist[base:base + maze.nc]
+    else:
+        for sq in distances:
+            table[sq.row*maze.nc + sq.column] = distances[sq]
+    return table
+
+def solution_table(maze, end):
+    """Return array holding position along the path (following prev from end) of each square, -1 if not on path."""
     path = []
     while end:
         path.append(end)
         end = end.prev
-        
+    
+    table = array('l', [-1]) * (maze.nr * maze.nc)
+    for pos, sq in enumerate(reversed(path)):
+        table[sq.row*maze.nc + sq.column] = pos
+    return table
+
+def write_table(maze, table, out):
+    """Write table from distance_table() or solution_table() in the format of output_distances(), one write per row."""
     for r in range(maze.nr):
-        for c in range(maze.nc):
-            sq = Square(r,c)
-            if maze.isWall(sq):
-                print('#', end=',')
-            else:
-                if sq in path:
-                    print(distances[sq], end=',')
-                else:
-                    print(0, end=',')
-        print()
+        base = r*maze.nc
+        cells = ['#' if wall == 1 else (str(d) if d >= 0 else '0') 
+                 for wall, d in zip(maze.grid[base:base + maze.nc], table[base:base + maze.nc])]
+        out.write(','.join(cells) + ',\n')
+
+def write_distances_csv(maze, distances, out):
+    """Write distance of each square to text file handle as CSV, one line per row; -1 for walls and unreached squares."""
+    table = distance_table(maze, distances)
+    for r in range(maze.nr):
+        out.write(','.join(map(str, table[r*maze.nc:(r+1)*maze.nc])) + '\n')
+
+def write_distances_binary(maze, distances, out):
+    """Write distance of each square to binary file handle in row-major order, as C longs in native byte order."""
+    distance_table(maze, distances).tofile(out)
 
 def load_maze(fname):
     """
@@ -259,9 +563,146 @@ def load_maze(fname):
         maze = Maze(int(nr), int(nc))
         for r in range(1, len(lines)):
             for c in range(nc):
-                maze.M[r-1][c] = 1 if lines[r][c] == '#' else 0
+                maze.grid[(r-1)*nc + c] = 1 if lines[r][c] == '#' else 0
+    return maze
+
+# Translation table for load_maze_fast(): '#' becomes 1 (a wall) and every other character becomes 0
+WALL_TABLE = bytes(1 if ch == ord('#') else 0 for ch in range(256))
+
+def load_maze_fast(fname, pad=False):
+    """
+    Load up a maze in the same format as load_maze(), but memory-map the file and convert each row of characters 
+    to walls in bulk using WALL_TABLE. Raises ValueError if the rows do not match the "#rows #columns" header. If
+    pad is True, short rows and missing rows are accepted and their remaining squares are empty, as in load_maze().
+    """
+    with open(fname, 'rb') as maze_file:
+        with mmap.mmap(maze_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            eol = mm.find(b'\n')
+            if eol < 0:
+                raise ValueError(f'{fname}: missing "#rows #columns" header')
+            (nr,nc) = [int(d) for d in mm[:eol].split()]
+            maze = Maze(nr, nc)
+            
+            size = len(mm)
+            pos = eol + 1
+            r = 0
+            while pos < size:
+                eol = mm.find(b'\n', pos)
+                if eol < 0:
+                    eol = size
+                last = eol - 1 if eol > pos and mm[eol-1] == ord('\r') else eol
+                length = last - pos
+                if r >= nr:
+                    if length > 0:
+                        raise ValueError(f'{fname}: more than the {nr} rows declared in header')
+                elif length > nc or (length < nc and not pad):
+                    raise ValueError(f'{fname}: row {r} has {length} squares but header declares {nc} columns')
+                else:
+                    maze.grid[r*nc:r*nc + length] = mm[pos:last].translate(WALL_TABLE)
+                r += 1
+                pos = eol + 1
+            
+            if r < nr and not pad:
+                raise ValueError(f'{fname}: only {r} of the {nr} rows declared in header')
+    return maze
+
+# Binary format: header followed by walls, either one byte per square or packed eight squares per byte
+BINARY_MAGIC = b'MAZE'
+BINARY_HEADER = struct.Struct('<4sBBxxIIIIII')   # magic, version, packed, rows, columns, start (r,c), end (r,c)
+BINARY_VERSION = 1
+
+def save_maze(maze, fname, packed=False):
+    """
+    Save maze in binary format. Unless packed is True, there is one byte per square so load_maze_binary() can 
+    use the file contents directly as the grid. Packed files are eight times smaller but must be unpacked on load.
+    The maze is written to a temporary file that then replaces fname, so a maze loaded from fname (whose grid
+    is still mapped from it) can be saved back to the same file.
+    """
+    start = maze.start()
+    end = maze.end()
+    header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 1 if packed else 0, maze.nr, maze.nc,
+                                start.row, start.column, end.row, end.column)
+    with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(fname)), delete=False) as maze_file:
+        try:
+            maze_file.write(header)
+            if packed:
+                maze_file.write(pack_walls(maze.grid))
+            else:
+                maze_file.write(maze.grid)
+        except BaseException:
+            maze_file.close()
+            os.remove(maze_file.name)
+            raise
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(maze_file.name, 0o666 & ~umask)          # temporary files are private; use the usual permissions
+    os.replace(maze_file.name, fname)
+
+def load_maze_binary(fname):
+    """
+    Load maze saved by save_maze(). An unpacked file is memory-mapped copy-on-write and the grid is a view over the
+    mapping, so nothing is copied: processes loading the same file share its pages, and changes to the maze are
+    never written back to the file.
+    """
+    with open(fname, 'rb') as maze_file:
+        mm = mmap.mmap(maze_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        if len(mm) < BINARY_HEADER.size:
+            raise ValueError(f'{fname}: too short to be a binary maze')
+        (magic, version, packed, nr, nc, start_r, start_c, end_r, end_c) = BINARY_HEADER.unpack_from(mm)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f'{fname}: not a binary maze (version {BINARY_VERSION})')
+        
+        size = (nr*nc + 7) // 8 if packed else nr*nc
+        if len(mm) != BINARY_HEADER.size + size:
+            raise ValueError(f'{fname}: expected {size} bytes of walls for {nr}x{nc} maze')
+        for (name, r, c) in [('start', start_r, start_c), ('end', end_r, end_c)]:
+            if not (0 <= r < nr and 0 <= c < nc):
+                raise ValueError(f'{fname}: {name} square ({r}, {c}) is outside {nr}x{nc} maze')
+    except ValueError:
+        mm.close()
+        raise
+    
+    if packed:
+        grid = unpack_walls(mm[BINARY_HEADER.size:], nr*nc)
+        mm.close()
+    else:
+        grid = memoryview(mm)[BINARY_HEADER.size:]
+    maze = Maze(nr, nc, grid)
+    maze.entrance = (start_r, start_c)
+    maze.exit = (end_r, end_c)
     return maze
 
+# Translation tables between one byte per square and the ASCII binary digits used to pack them
+TO_DIGITS = bytes(ord('1') if ch else ord('0') for ch in range(256))
+FROM_DIGITS = bytes(1 if ch == ord('1') else 0 for ch in range(256))
+
+def pack_walls(grid):
+    """Pack grid (one byte per square) into bits, first square in the most significant bit of first byte."""
+    size = (len(grid) + 7) // 8
+    if size == 0:
+        return b''
+    digits = bytes(grid).translate(TO_DIGITS) + b'0' * (size*8 - len(grid))
+    return int(digits, 2).to_bytes(size, 'big')
+
+def unpack_walls(data, count):
+    """Unpack first count squares of bits produced by pack_walls() into a bytearray with one byte per square."""
+    digits = format(int.from_bytes(data, 'big'), f'0{len(data)*8}b').encode()
+    return bytearray(digits[:count].translate(FROM_DIGITS))
+
+def visited_trial():
+    """Compare number of squares visited by bfs, astar and bidirectional_bfs on random mazes of size NxN."""
+    for N in [16, 32, 64, 128, 256]:
+        random.seed(N)
+        M = Maze(N, N)
+        M.random(.1)
+        M.setWall(Square(1, N//2), False)     # keep entrance and exit from being blocked
+        M.setWall(Square(N-2, N//2), False)
+        for search in [bfs, astar, bidirectional_bfs]:
+            stats = {}
+            (_, end) = search(M, stats)
+            print(search.__name__, N, path_length(end), stats['visited'])
+
 def path_length(sq):
     """Quickly compute the length of the path from the entrance to the given square based on prev links."""
     ct = 0
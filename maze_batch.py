@@ -0,0 +1,115 @@
+"""
+Solve a large batch of independent mazes in parallel, using a pool of worker processes.
+
+Each maze in the batch can be given as:
+
+    * a Maze object, whose grid is copied once into shared memory, from which the worker uses it directly
+      (rather than pickling the maze to send it to the worker);
+    * the name of a file, which the worker loads itself, either with load_maze_binary() for files saved by
+      save_maze() or with load_maze_fast() for the text format; or
+    * a tuple (rows, columns, density, seed), from which the worker generates the maze with Maze.random().
+
+Results are yielded as soon as each maze is solved (not necessarily in order) as a tuple
+(position in batch, solvable, path length, squares visited), where path length counts squares on the path
+just like maze.path_length() and is 0 when there is no solution, and squares visited counts the squares
+removed from the queue, just like the stats recorded by maze.bfs().
+
+Run from the command line to solve a batch of random mazes or maze files, for example:
+
+    python maze_batch.py --count 64 --size 500 --density .25 --seed 1
+    python maze_batch.py sample.maze eight.maze
+"""
+import argparse
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from maze import Maze, BINARY_MAGIC, load_maze_binary, load_maze_fast, path_length
+import maze_search
+
+def solve(maze):
+    """Return (solvable, path length, squares visited) for maze, where visited is the same as for maze.bfs()."""
+    stats = {}
+    (_, end) = maze_search.bfs(maze, stats)
+    return (end is not None, path_length(end), stats['visited'])
+
+def load(fname):
+    """Load maze from file in either binary or text format."""
+    with open(fname, 'rb') as maze_file:
+        binary = maze_file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    return load_maze_binary(fname) if binary else load_maze_fast(fname, pad=True)
+
+def solve_shared(name, nr, nc, entrance, exit):
+    """Worker: solve maze whose grid is in the named shared memory block."""
+    shm = shared_memory.SharedMemory(name=name)
+    maze = None
+    try:
+        maze = Maze(nr, nc, shm.buf[:nr*nc])
+        maze.entrance = entrance
+        maze.exit = exit
+        return solve(maze)
+    finally:
+        # Release views of the shared memory so it can be closed, even if an error (whose traceback may still
+        # refer to the maze) is being raised
+        if maze is not None:
+            for row in maze.M:
+                row.release()
+            maze.grid.release()
+        shm.close()
+
+def solve_file(fname):
+    """Worker: load maze from file and solve it."""
+    return solve(load(fname))
+
+def solve_random(nr, nc, density, seed):
+    """Worker: generate random maze from seed and solve it."""
+    random.seed(seed)
+    maze = Maze(nr, nc)
+    maze.random(density)
+    return solve(maze)
+
+def solve_batch(mazes, workers=None):
+    """Solve each maze in parallel, yielding (position, solvable, path length, visited) as each one finishes."""
+    blocks = {}              # shared memory for the Maze objects, released once that maze is solved
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        try:
+            for idx, spec in enumerate(mazes):
+                if isinstance(spec, Maze):
+                    shm = shared_memory.SharedMemory(create=True, size=max(1, len(spec.grid)))
+                    shm.buf[:len(spec.grid)] = spec.grid
+                    blocks[idx] = shm
+                    future = pool.submit(solve_shared, shm.name, spec.nr, spec.nc, spec.entrance, spec.exit)
+                elif isinstance(spec, str):
+                    future = pool.submit(solve_file, spec)
+                else:
+                    future = pool.submit(solve_random, *spec)
+                futures[future] = idx
+
+            for future in as_completed(futures):
+                idx = futures[future]
+                if idx in blocks:
+                    blocks.pop(idx).unlink()
+                yield (idx,) + future.result()
+        finally:
+            for shm in blocks.values():
+                shm.unlink()
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Solve a batch of mazes in parallel.')
+    parser.add_argument('files', nargs='*', help='maze files to solve (text or binary format)')
+    parser.add_argument('--count', type=int, default=0, help='number of random mazes to generate and solve')
+    parser.add_argument('--size', type=int, default=100, help='number of rows and columns of random mazes')
+    parser.add_argument('--density', type=float, default=.2, help='density of walls in random mazes')
+    parser.add_argument('--seed', type=int, default=0, help='seed of first random maze; each maze uses the next')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes (default is one per core)')
+    options = parser.parse_args(args)
+
+    specs = list(options.files)
+    specs.extend((options.size, options.size, options.density, options.seed + i) for i in range(options.count))
+    for (idx, solvable, length, visited) in solve_batch(specs, options.workers):
+        name = specs[idx] if isinstance(specs[idx], str) else f'seed={specs[idx][3]}'
+        print(f'{idx},{name},{solvable},{length},{visited}', flush=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+Label the connected regions of empty squares in a maze, so questions of reachability take constant time.
+
+Rather than visit each square, each row is scanned for runs of consecutive empty squares (using bytes.find, so
+runs are found in bulk). A run is in the same region as every run of the previous row whose columns overlap
+with it, which is recorded using Union-Find. Once all rows are scanned, each region is given a label from 0 to
+count-1. Only the runs are stored, so memory depends on the number of runs, not the number of squares.
+
+A maze is solvable exactly when bfs() would find a path, which you can determine in a single linear sweep:
+
+    Components(maze).is_solvable()
+"""
+from bisect import bisect_right
+
+def runs(row):
+    """Return (starts, ends) of each run of empty squares in a row of walls (bytes, 1 is a wall); ends are inclusive."""
+    starts, ends = [], []
+    c = row.find(0)
+    while c >= 0:
+        end = row.find(1, c)
+        if end < 0:
+            end = len(row)
+        starts.append(c)
+        ends.append(end - 1)
+        c = row.find(0, end)
+    return (starts, ends)
+
+class Components:
+    def __init__(self, maze):
+        self.maze = maze
+        self.version = maze.version
+        self.starts = []                  # for each row, the first column of each run
+        self.ends = []                    # for each row, the last column of each run
+        self.first = []                   # for each row, the number of the first run in that row
+        parent = []                       # Union-Find over runs
+
+        def find(run):
+            while parent[run] != run:
+                parent[run] = parent[parent[run]]
+                run = parent[run]
+            return run
+
+        nc = maze.nc
+        lengths = []
+        for r in range(maze.nr):
+            (starts, ends) = runs(bytes(maze.grid[r*nc:(r+1)*nc]))
+
+            first = len(parent)
+            for i in range(len(starts)):
+                parent.append(first + i)
+                lengths.append(ends[i] - starts[i] + 1)
+
+            # Join with overlapping runs from previous row
+            if r > 0:
+                above, above_starts, above_ends = self.first[-1], self.starts[-1], self.ends[-1]
+                i = j = 0
+                while i < len(starts) and j < len(above_starts):
+                    if starts[i] <= above_ends[j] and above_starts[j] <= ends[i]:
+                        a, b = find(first + i), find(above + j)
+                        if a != b:
+                            parent[a] = b
+                    if ends[i] < above_ends[j]:
+                        i += 1
+                    else:
+                        j += 1
+
+            self.starts.append(starts)
+            self.ends.append(ends)
+            self.first.append(first)
+
+        # Assign labels 0, 1, 2, ... to the regions and total up their sizes
+        self.labels = [0] * len(parent)
+        self.sizes = []
+        roots = {}
+        for run in range(len(parent)):
+            root = find(run)
+            if root not in roots:
+                roots[root] = len(self.sizes)
+                self.sizes.append(0)
+            self.labels[run] = roots[root]
+            self.sizes[roots[root]] += lengths[run]
+
+    def count(self):
+        """Number of regions."""
+        return len(self.sizes)
+
+    def component_of(self, sq):
+        """Label of region containing square, or None if it is a wall or outside the maze."""
+        if not self.maze.isValid(sq):
+            return None
+        i = bisect_right(self.starts[sq.row], sq.column) - 1
+        if i < 0 or self.ends[sq.row][i] < sq.column:
+            return None
+        return self.labels[self.first[sq.row] + i]
+
+    def size(self, sq):
+        """Number of squares in region containing square (0 if it is a wall)."""
+        label = self.component_of(sq)
+        return 0 if label is None else self.sizes[label]
+
+    def connected(self, a, b):
+        """Determine if there is a path between two empty squares."""
+        label = self.component_of(a)
+        return label is not None and label == self.component_of(b)
+
+    def is_solvable(self):
+        """Determine if there is a path from start to end, exactly when bfs() would find one."""
+        start = self.maze.start()
+        end = self.maze.end()
+        if start == end:
+            return True
+        if self.component_of(start) is None:      # bfs() still explores from start when it is a wall
+            return any(self.connected(n, end) for n in self.maze.neighbors(start))
+        return self.connected(start, end)
+
+def components(maze):
+    """Return Components for maze, reusing the one cached on the maze unless it has since been changed by setWall()."""
+    cached = getattr(maze, 'components', None)
+    if cached is None or cached.version != maze.version:
+        cached = maze.components = Components(maze)
+    return cached
+
+if __name__ == '__main__':
+    import time
+    from maze import Maze, bfs
+
+    mazes = []
+    for seed in range(100):
+        M = Maze(200, 200)
+        M.random_fast(.4, seed)
+        mazes.append(M)
+
+    now = time.perf_counter()
+    solvable = sum(1 for M in mazes if Components(M).is_solvable())
+    print(f'{solvable} of {len(mazes)} mazes solvable, labeled in {time.perf_counter() - now:.3f}s')
+
+    now = time.perf_counter()
+    solvable = sum(1 for M in mazes if bfs(M)[1])
+    print(f'{solvable} of {len(mazes)} mazes solvable, using bfs in {time.perf_counter() - now:.3f}s')
@@ -0,0 +1,149 @@
+"""
+Shortest path from start to end of a maze whose walls are added or removed one square at a time.
+
+DynamicSolver uses Lifelong Planning A* (LPA*). Every square has a distance g from the start, as computed so
+far, and a one-step lookahead rhs (one more than the smallest g of its neighbors). A square is consistent when
+the two agree. When a wall changes, only that square and its neighbors are updated, and the inconsistent
+squares are processed in A* order (using Manhattan distance to the end) until the distance to the end is
+known again. Since only squares whose distance actually changed are processed, the work per edit scales with
+the size of the change and not with the size of the maze.
+
+Edits must go through Maze.setWall(), which notifies the solver.
+"""
+import heapq
+import sys
+from array import array
+
+from maze_search import Grid, UNSEEN, path_to
+
+INFINITY = sys.maxsize // 2    # Distance for squares that cannot be reached; safe to add 1 to
+
+class DynamicSolver:
+    def __init__(self, maze):
+        self.maze = maze
+        maze.listeners.append(self.changed)
+        self.reset()
+
+    def reset(self):
+        """Start over from the current walls of the maze."""
+        self.grid = Grid(self.maze)
+        self.version = self.maze.version
+        self.start = self.grid.index(self.maze.start())
+        self.goal = self.grid.index(self.maze.end())
+        self.goal_r, self.goal_c = divmod(self.goal, self.grid.W)
+        self.g = array('l', [INFINITY]) * self.grid.size
+        self.rhs = array('l', [INFINITY]) * self.grid.size
+        self.rhs[self.start] = 0
+        self.pq = [(self.key(self.start), self.start)]
+        self.expanded = 0      # number of squares processed, to measure work done
+
+    def detach(self):
+        """Stop receiving wall changes from the maze."""
+        self.maze.listeners.remove(self.changed)
+
+    def key(self, u):
+        r, c = divmod(u, self.grid.W)
+        m = min(self.g[u], self.rhs[u])
+        return (m + abs(r - self.goal_r) + abs(c - self.goal_c), m)
+
+    def update(self, u):
+        """Recompute rhs for u and queue u if it has become inconsistent."""
+        if u != self.start:
+            if self.grid.walls[u]:
+                self.rhs[u] = INFINITY
+            else:
+                g = self.g
+                self.rhs[u] = min(INFINITY, min(g[u + off] for off in self.grid.offsets) + 1)
+        if self.g[u] != self.rhs[u]:
+            heapq.heappush(self.pq, (self.key(u), u))
+
+    def changed(self, sq):
+        """Called by Maze.setWall() after sq has changed."""
+        if self.maze.version != self.version + 1:      # maze was also changed without telling us
+            self.reset()
+            return
+        self.version = self.maze.version
+
+        u = self.grid.index(sq)
+        self.grid.walls[u] = 1 if self.maze.isWall(sq) else 0
+        self.update(u)
+        for off in self.grid.offsets:
+            self.update(u + off)
+
+    def compute(self):
+        """Process inconsistent squares until the distance to the end is correct."""
+        g, rhs, pq, goal = self.g, self.rhs, self.pq, self.goal
+        while pq:
+            (k, u) = pq[0]
+            if g[u] == rhs[u] or k != self.key(u):
+                heapq.heappop(pq)          # stale entry: a more recent one was queued if still needed
+                continue
+            if k >= self.key(goal) and g[goal] == rhs[goal]:
+                break
+
+            heapq.heappop(pq)
+            self.expanded += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]              # distance has decreased (or is now known)
+            else:
+                g[u] = INFINITY            # distance has increased, so recompute from neighbors
+                self.update(u)
+            for off in self.grid.offsets:
+                self.update(u + off)
+
+    def distance(self):
+        """Return length of shortest path from start to end, or None if there is none."""
+        if self.maze.version != self.version:
+            self.reset()
+        self.compute()
+        return None if self.g[self.goal] >= INFINITY else self.g[self.goal]
+
+    def path(self):
+        """Return end square of a shortest path from start (linked by prev), or None if there is none."""
+        if self.distance() is None:
+            return None
+
+        parent = {self.start: UNSEEN}
+        u = self.goal
+        while u != self.start:
+            for off in self.grid.offsets:
+                n = u + off
+                if self.g[n] == self.g[u] - 1 and (n == self.start or not self.grid.walls[n]):
+                    parent[u] = n
+                    u = n
+                    break
+        return path_to(self.grid, parent, self.goal)
+
+if __name__ == '__main__':
+    import random
+    import time
+    from maze import Maze, Square
+    import maze_search
+
+    random.seed(7)
+    N = 400
+    M = Maze(N, N)
+    M.random(.25)
+    M.setWall(Square(1, N//2), False)
+    M.setWall(Square(N-2, N//2), False)
+    solver = DynamicSolver(M)
+    print('initial distance', solver.distance(), 'after processing', solver.expanded, 'squares')
+
+    initial = solver.expanded
+    incremental = full = reprocessed = 0
+    for _ in range(200):
+        sq = Square(random.randint(1, N-2), random.randint(1, N-2))
+        M.setWall(sq, not M.isWall(sq))
+        before = solver.expanded
+        now = time.perf_counter()
+        d = solver.distance()
+        incremental += time.perf_counter() - now
+        reprocessed += solver.expanded - before
+
+        now = time.perf_counter()
+        (dist, end) = maze_search.bfs(M)
+        full += time.perf_counter() - now
+        if (dist[end] if end else None) != d:
+            print('MISMATCH', d)
+    print(f'200 edits: incremental {incremental:.3f}s vs. full bfs {full:.3f}s')
+    print(f'each edit processed {reprocessed / 200:.1f} squares on average, vs. {initial} for the initial search')
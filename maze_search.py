@@ -0,0 +1,428 @@
+"""
+Integer-indexed implementations of the searches in maze.py, suitable for very large mazes.
+
+The searches in maze.py create a new Square for every neighbor they consider, hash it into a dictionary and
+attach a 'prev' attribute to it. The functions here instead work on integer positions within a copy of the
+maze grid that is surrounded by a border of walls. The four neighbors of position i are then i-W, i+W, i-1 and
+i+1 (W being the width of a padded row), so no bounds checks are needed. Distances and parents are stored in
+preallocated arrays, and Square objects are only created once the final path is requested.
+
+Each function returns the same result as its counterpart in maze.py: the Squares along the path carry 'prev'
+links, and the distances can be looked up by Square exactly like the dictionary computed by maze.bfs().
+"""
+import heapq
+from array import array
+from collections.abc import Mapping
+
+from maze import Square
+
+UNSEEN = -1                  # Distance (and parent) of a square that has not been reached
+
+class Grid:
+    """
+    The walls of a maze surrounded by a border of walls, with helpers to convert between Square and position.
+    The neighbor offsets are ordered up, down, left, right to match Maze.neighbors().
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.W = maze.nc + 2
+        self.size = (maze.nr + 2) * self.W
+        self.walls = bytearray(b'\x01') * self.size
+        for r in range(maze.nr):
+            base = (r+1)*self.W + 1
+            self.walls[base:base + maze.nc] = maze.grid[r*maze.nc:(r+1)*maze.nc]
+        self.offsets = (-self.W, self.W, -1, 1)
+
+    def index(self, sq):
+        return (sq.row+1)*self.W + sq.column + 1
+
+    def square(self, idx):
+        r, c = divmod(idx, self.W)
+        return Square(r-1, c-1)
+
+    def table(self):
+        """Return new array with an entry for each position, all set to UNSEEN."""
+        return array('l', [UNSEEN]) * self.size
+
+class Distances(Mapping):
+    """Read-only mapping from Square to the distance computed for it, backed by an array of positions."""
+    def __init__(self, grid, dist):
+        self.grid = grid
+        self.dist = dist
+
+    def __contains__(self, sq):
+        if not self.grid.maze.isValid(sq):
+            return False
+        return self.dist[self.grid.index(sq)] != UNSEEN
+
+    def __getitem__(self, sq):
+        if sq not in self:
+            raise KeyError(sq)
+        return self.dist[self.grid.index(sq)]
+
+    def __len__(self):
+        return len(self.dist) - self.dist.count(UNSEEN)
+
+    def __iter__(self):
+        for idx, d in enumerate(self.dist):
+            if d != UNSEEN:
+                yield self.grid.square(idx)
+
+def path_to(grid, parent, idx):
+    """Create the Squares on the path ending at idx (following parent) and return last one, linked by prev."""
+    positions = []
+    while idx != UNSEEN:
+        positions.append(idx)
+        idx = parent[idx]
+
+    prev = None
+    for idx in reversed(positions):
+        sq = grid.square(idx)
+        sq.prev = prev
+        prev = sq
+    return prev
+
+def search(grid, start, end, stack=False, stats=None):
+    """
+    Search from position start until position end is removed from the queue (or from the stack, if stack is True).
+    Return (dist, parent, found) where found is True if end was reached. If stats dictionary is provided,
+    stats['visited'] records number of positions removed from the queue (or stack), just like maze.bfs().
+    """
+    seen = bytearray(grid.walls)     # walls are never explored, so treat them as already seen
+    dist = grid.table()
+    parent = grid.table()
+    offsets = grid.offsets
+
+    seen[start] = 1
+    dist[start] = 0
+    if stack:
+        pending = [start]
+        pop = pending.pop
+        push = pending.append
+        visited = 0
+        while pending:
+            s = pop()
+            visited += 1
+            if s == end:
+                if stats is not None: stats['visited'] = visited
+                return (dist, parent, True)
+
+            d = dist[s] + 1
+            for off in offsets:
+                n = s + off
+                if not seen[n]:
+                    seen[n] = 1
+                    dist[n] = d
+                    parent[n] = s
+                    push(n)
+        if stats is not None: stats['visited'] = visited
+        return (dist, parent, False)
+
+    queue = [start]                  # list is only appended to, so iterating over it processes it in FIFO order
+    push = queue.append
+    for s in queue:
+        if s == end:
+            if stats is not None: stats['visited'] = queue.index(end) + 1
+            return (dist, parent, True)
+
+        d = dist[s] + 1
+        for off in offsets:
+            n = s + off
+            if not seen[n]:
+                seen[n] = 1
+                dist[n] = d
+                parent[n] = s
+                push(n)
+    if stats is not None: stats['visited'] = len(queue)
+    return (dist, parent, False)
+
+def flood(grid, sources):
+    """Breadth-First Search from all source positions at once, exploring everything. Return (dist, parent)."""
+    seen = bytearray(grid.walls)
+    dist = grid.table()
+    parent = grid.table()
+    offsets = grid.offsets
+
+    queue = []
+    for s in sources:
+        if dist[s] == UNSEEN:
+            seen[s] = 1
+            dist[s] = 0
+            queue.append(s)
+
+    push = queue.append
+    for s in queue:
+        d = dist[s] + 1
+        for off in offsets:
+            n = s + off
+            if not seen[n]:
+                seen[n] = 1
+                dist[n] = d
+                parent[n] = s
+                push(n)
+    return (dist, parent)
+
+class DistanceField:
+    """
+    Distance from the nearest of the source squares (by default just maze.start()) to every square of the maze,
+    together with a shortest path back to that source. Computed once, after which distance() takes constant time
+    and path() takes time proportional to the length of the path. The field reflects the maze at the time it was
+    computed; use distance_field() to reuse a field until the maze changes.
+    """
+    def __init__(self, maze, sources=None):
+        if sources is None:
+            sources = [maze.start()]
+        self.grid = Grid(maze)
+        self.version = maze.version
+        self.sources = tuple((sq.row, sq.column) for sq in sources)
+        (self.dist, self.parent) = flood(self.grid, [self.grid.index(sq) for sq in sources])
+        self.distances = Distances(self.grid, self.dist)
+
+    def distance(self, to):
+        """Return distance to square from nearest source, or None if it cannot be reached."""
+        return self.distances.get(to)
+
+    def path(self, to):
+        """Return square at end of a shortest path from nearest source (linked by prev), or None if unreachable."""
+        if to not in self.distances:
+            return None
+        return path_to(self.grid, self.parent, self.grid.index(to))
+
+def distance_field(maze, sources=None):
+    """
+    Return the DistanceField for sources (default is maze.start()), reusing one cached on the maze unless the
+    maze has since been changed by Maze.setWall().
+    """
+    if sources is None:
+        sources = [maze.start()]
+    key = tuple((sq.row, sq.column) for sq in sources)
+
+    fields = getattr(maze, 'distance_fields', None)
+    if fields is None or fields['version'] != maze.version:
+        fields = maze.distance_fields = {'version': maze.version}
+    if key not in fields:
+        fields[key] = DistanceField(maze, sources)
+    return fields[key]
+
+def bfs(maze, stats=None):
+    """Same as maze.bfs() but using integer positions."""
+    grid = Grid(maze)
+    end = grid.index(maze.end())
+    (dist, parent, found) = search(grid, grid.index(maze.start()), end, stats=stats)
+    return (Distances(grid, dist), path_to(grid, parent, end) if found else None)
+
+def dfs(maze):
+    """Same as maze.dfs() but using integer positions."""
+    grid = Grid(maze)
+    end = grid.index(maze.end())
+    (_, parent, found) = search(grid, grid.index(maze.start()), end, stack=True)
+    return path_to(grid, parent, end) if found else None
+
+def dfs_distance(maze):
+    """Same as maze.dfs_distance() but using integer positions."""
+    grid = Grid(maze)
+    end = grid.index(maze.end())
+    (dist, parent, found) = search(grid, grid.index(maze.start()), end, stack=True)
+    return (Distances(grid, dist), path_to(grid, parent, end) if found else None)
+
+def dfs_iterative(maze):
+    """
+    Same as maze.dfs_recursive() (and maze.dfs_iterative()) but using integer positions. Two parallel stacks record
+    each position on the current path and the index of the next neighbor offset to try from there.
+    """
+    grid = Grid(maze)
+    seen = bytearray(grid.walls)
+    parent = grid.table()
+    offsets = grid.offsets
+    start = grid.index(maze.start())
+    end = grid.index(maze.end())
+
+    seen[start] = 1
+    if start == end:
+        return path_to(grid, parent, end)
+
+    positions = [start]
+    directions = [0]
+    while positions:
+        s = positions[-1]
+        k = directions[-1]
+        while k < 4:
+            n = s + offsets[k]
+            k += 1
+            if not seen[n]:
+                break
+        else:
+            positions.pop()
+            directions.pop()
+            continue
+
+        directions[-1] = k
+        seen[n] = 1
+        parent[n] = s
+        if n == end:
+            return path_to(grid, parent, end)
+        positions.append(n)
+        directions.append(0)
+    return None
+
+def horizontal_stops(grid, goal):
+    """
+    Return pair of bytes, for horizontal runs moving right and left, with a 1 at each position where such a run
+    must stop: walls, the goal, and squares with a forced neighbor. All positions are computed at once by treating
+    the walls as one large integer holding a byte per position, where shifting by k bytes moves each wall k
+    positions.
+    """
+    size = grid.size
+    ones = int.from_bytes(b'\x01' * size, 'little')
+    walls = int.from_bytes(grid.walls, 'little')
+
+    def shifted(k):
+        """Integer whose byte n is the wall at position n-k."""
+        return ((walls << 8*k) & ones) if k >= 0 else walls >> -8*k
+
+    W = grid.W
+    open_above = shifted(W) ^ ones
+    open_below = shifted(-W) ^ ones
+    result = []
+    for d in [1, -1]:
+        stops = walls | (open_above & shifted(W+d)) | (open_below & shifted(d-W))
+        stops = bytearray(stops.to_bytes(size, 'little'))
+        stops[goal] = 1
+        result.append(stops)
+    return tuple(result)
+
+def jps(maze, stats=None):
+    """
+    Jump Point Search adapted to a 4-connected grid with uniform cost. Returns (dist, end) just like maze.bfs(),
+    with a shortest path from start to end, but dist only contains the jump points that were reached and the squares
+    on the path. If stats dictionary is provided, stats['visited'] records number of jump points expanded.
+
+    Among shortest paths, only those that move vertically and then turn horizontally are considered, so straight
+    runs through open space are skipped over in a single step. A horizontal run stops at a square where a new
+    vertical opening appears (a 'forced' neighbor); a vertical run stops where a horizontal opening appears, or
+    where a horizontal run from that square would stop. The stopping points of horizontal runs are computed up
+    front by horizontal_stops(), so each horizontal run is a single search of a bytearray.
+    """
+    grid = Grid(maze)
+    walls = grid.walls
+    W = grid.W
+    start = grid.index(maze.start())
+    goal = grid.index(maze.end())
+    goal_r, goal_c = divmod(goal, W)
+
+    (right_stops, left_stops) = horizontal_stops(grid, goal)
+
+    def jump_horizontal(n, d):
+        """Return next jump point moving horizontally from n-d through n, or None."""
+        n = right_stops.find(1, n) if d == 1 else left_stops.rfind(1, 0, n+1)
+        return None if walls[n] else n
+
+    def jump_vertical(n, d):
+        """Return next jump point moving vertically from n-d through n, or None."""
+        while not walls[n]:
+            if n == goal:
+                return n
+            if (not walls[n-1] and walls[n-d-1]) or (not walls[n+1] and walls[n-d+1]):
+                return n
+            if jump_horizontal(n+1, 1) is not None or jump_horizontal(n-1, -1) is not None:
+                return n
+            n += d
+        return None
+
+    def estimate(n):
+        r, c = divmod(n, W)
+        return abs(r - goal_r) + abs(c - goal_c)
+
+    dist = grid.table()
+    parent = grid.table()
+    done = bytearray(grid.size)
+    dist[start] = 0
+    pq = [(estimate(start), 0, start)]
+    visited = 0
+    found = False
+    while pq:
+        (_, _, s) = heapq.heappop(pq)
+        if done[s]:
+            continue
+        done[s] = 1
+        visited += 1
+        if s == goal:
+            found = True
+            break
+
+        # Prune directions based on how s was reached; the start considers all four
+        p = parent[s]
+        if p == UNSEEN:
+            moves = [(-W, jump_vertical), (W, jump_vertical), (-1, jump_horizontal), (1, jump_horizontal)]
+        elif abs(s - p) < W:
+            d = 1 if s > p else -1
+            moves = [(-W, jump_vertical), (W, jump_vertical), (d, jump_horizontal)]
+        else:
+            d = W if s > p else -W
+            moves = [(-1, jump_horizontal), (1, jump_horizontal), (d, jump_vertical)]
+
+        for (d, jump) in moves:
+            n = jump(s + d, d)
+            if n is None or done[n]:
+                continue
+            g = dist[s] + abs(n - s) // abs(d)
+            if dist[n] == UNSEEN or g < dist[n]:
+                dist[n] = g
+                parent[n] = s
+                heapq.heappush(pq, (g + estimate(n), -g, n))
+
+    if stats is not None: stats['visited'] = visited
+    if not found:
+        return (Distances(grid, dist), None)
+
+    # Fill in the squares between successive jump points
+    n = goal
+    while parent[n] != UNSEEN:
+        p = parent[n]
+        step = (1 if abs(n - p) < W else W) * (1 if n > p else -1)
+        sq = n - step
+        while sq != p:
+            dist[sq] = dist[n] - abs(n - sq) // abs(step)
+            parent[sq] = p
+            parent[sq + step] = sq
+            sq -= step
+        n = p
+    return (Distances(grid, dist), path_to(grid, parent, goal))
+
+def visited_trial():
+    """Compare number of squares visited by maze.bfs and jump points expanded by jps on sparse random mazes."""
+    import random
+    import maze
+
+    for N in [16, 32, 64, 128, 256, 512]:
+        for density in [.01, .05, .1]:
+            random.seed(N)
+            M = maze.Maze(N, N)
+            M.random(density)
+            M.setWall(Square(1, N//2), False)     # keep entrance and exit from being blocked
+            M.setWall(Square(N-2, N//2), False)
+            before = {}
+            after = {}
+            (_, end) = maze.bfs(M, before)
+            (_, end_jps) = jps(M, after)
+            print(N, density, maze.path_length(end), before['visited'], maze.path_length(end_jps), after['visited'])
+
+def timing_trial():
+    """Compare searches in maze.py against these integer-indexed ones on random mazes of size NxN."""
+    import random
+    import timeit
+    import maze
+
+    for N in [64, 128, 256, 512, 1024]:
+        random.seed(N)
+        M = maze.Maze(N, N)
+        M.random(.1)
+        M.setWall(Square(1, N//2), False)     # keep entrance and exit from being blocked
+        M.setWall(Square(N-2, N//2), False)
+        for name in ['bfs', 'dfs_distance']:
+            before = timeit.timeit(lambda: getattr(maze, name)(M), number=1)
+            after = timeit.timeit(lambda: globals()[name](M), number=1)
+            print(name, N, f'{before:.4f}', f'{after:.4f}', f'{before/after:.1f}x')
+
+if __name__ == '__main__':
+    timing_trial()
@@ -0,0 +1,226 @@
+"""
+Solve a maze stored in the text format of load_maze() while reading it one row at a time, so mazes far larger
+than memory (such as tall strips) can still be solved.
+
+stream_reachable() determines if there is a path from start to end. Only the runs of empty squares in the
+current row are kept, each labeled with its connected region (as in maze_components); when a run overlaps
+runs in the previous row their regions are joined. Memory is proportional to the number of columns.
+
+stream_distance() computes the length of the shortest path. The shortest path may dip below a row and come
+back up again, so for every pair of gates in the current row (empty squares with an empty square below them)
+it keeps their shortest distance using only the rows read so far, together with the distances to the start
+and end squares. When the next row is read these distances are extended using the squares of that row.
+Memory is proportional to the square of the number of columns (but does not depend on the number of rows),
+while each row takes time proportional to the cube of the number of gates in it: about 4ms a row for 60
+columns, but over 100ms a row for 200 columns. So stream_distance() only accepts mazes with at most
+MAX_COLUMNS columns, meant for tall narrow strips; solve wider mazes that fit in memory with maze_search.bfs().
+
+Both treat the start square as empty, just as bfs() explores from start even when it is a wall.
+"""
+from maze import WALL_TABLE
+from maze_components import runs
+
+INFINITY = float('inf')
+
+class RowReader:
+    """
+    Iterate over the rows of a maze file, reading one line at a time. Each row is a bytes object with 1 for a wall
+    and 0 for an empty square. Rows are validated against the header just like load_maze_fast().
+    """
+    def __init__(self, fname, pad=False):
+        self.fname = fname
+        self.pad = pad
+        with open(fname, 'rb') as maze_file:
+            (self.nr, self.nc) = [int(d) for d in maze_file.readline().split()]
+
+    def __iter__(self):
+        with open(self.fname, 'rb') as maze_file:
+            maze_file.readline()
+            r = 0
+            for line in maze_file:
+                line = line.rstrip(b'\r\n')
+                if r >= self.nr:
+                    if line:
+                        raise ValueError(f'{self.fname}: more than the {self.nr} rows declared in header')
+                    continue
+                if len(line) > self.nc or (len(line) < self.nc and not self.pad):
+                    raise ValueError(f'{self.fname}: row {r} has {len(line)} squares but header declares {self.nc} columns')
+                yield line.translate(WALL_TABLE) + bytes(self.nc - len(line))
+                r += 1
+
+            if r < self.nr:
+                if not self.pad:
+                    raise ValueError(f'{self.fname}: only {r} of the {self.nr} rows declared in header')
+                for _ in range(r, self.nr):
+                    yield bytes(self.nc)
+
+def endpoints(reader, start, end):
+    """Return start and end as (row, column), by default the middle of top row and bottom row like Maze."""
+    start = (0, reader.nc//2) if start is None else (start.row, start.column)
+    end = (reader.nr-1, reader.nc//2) if end is None else (end.row, end.column)
+    return (start, end)
+
+def opened(row, c):
+    """Return row with square at column c made empty."""
+    return row[:c] + b'\x00' + row[c+1:]
+
+def stream_reachable(fname, start=None, end=None, pad=False):
+    """Determine whether end can be reached from start (default to those of Maze) reading one row at a time."""
+    reader = RowReader(fname, pad)
+    ((sr, sc), (er, ec)) = endpoints(reader, start, end)
+    if (sr, sc) == (er, ec):
+        return True
+
+    prev_starts = []         # runs of previous row, and label of region for each one
+    prev_ends = []
+    prev_labels = []
+    start_label = end_label = None
+    for r, row in enumerate(reader):
+        if r == sr:
+            row = opened(row, sc)
+        (starts, ends) = runs(row)
+        count = max(prev_labels, default=-1) + 1
+
+        # Union-Find over the labels of previous row (0 .. count-1) and the runs of this row (count ..)
+        parent = list(range(count + len(starts)))
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        i = j = 0
+        while i < len(starts) and j < len(prev_ends):
+            if starts[i] <= prev_ends[j] and prev_starts[j] <= ends[i]:
+                parent[find(count + i)] = find(prev_labels[j])
+            if ends[i] < prev_ends[j]:
+                i += 1
+            else:
+                j += 1
+
+        def run_of(c):
+            for i in range(len(starts)):
+                if starts[i] <= c <= ends[i]:
+                    return count + i
+            return None
+
+        start_root = find(start_label) if start_label is not None else None
+        end_root = find(end_label) if end_label is not None else None
+        if r == sr:
+            start_root = find(run_of(sc))
+        if r == er:
+            if run_of(ec) is None:
+                return False                     # end is a wall
+            end_root = find(run_of(ec))
+        if start_root is not None and start_root == end_root:
+            return True
+
+        # Relabel regions that continue into this row as 0, 1, 2, ...; any other region is finished
+        labels = {}
+        prev_labels = [labels.setdefault(find(count + i), len(labels)) for i in range(len(starts))]
+        prev_starts, prev_ends = starts, ends
+        start_label = labels.get(start_root)
+        end_label = labels.get(end_root)
+        if (r >= sr and start_label is None) or (r >= er and end_label is None):
+            return False                         # region with start (or end) cannot grow any further
+    return False
+
+MAX_COLUMNS = 64
+
+def stream_distance(fname, start=None, end=None, pad=False):
+    """
+    Return length of shortest path from start to end (default to those of Maze) reading one row at a time, or None
+    if there is no path. This is the same as the distance computed for the end square by bfs(). Raises ValueError
+    for mazes with more than MAX_COLUMNS columns.
+    """
+    reader = RowReader(fname, pad)
+    if reader.nc > MAX_COLUMNS:
+        raise ValueError(f'{fname}: {reader.nc} columns is more than the {MAX_COLUMNS} stream_distance() supports')
+    ((sr, sc), (er, ec)) = endpoints(reader, start, end)
+    if (sr, sc) == (er, ec):
+        return 0
+
+    # Nodes are the gates of the previous row (empty squares with an empty square below them) followed by the
+    # start and end squares once reached; D holds the shortest distance between every pair of nodes using only
+    # the rows read so far.
+    gates = []
+    terminals = []           # 'start' and/or 'end'
+    D = []
+    rows = iter(reader)
+    below = next(rows, None)
+    for r in range(reader.nr):
+        row, below = below, next(rows, None)
+        if r == sr:
+            row = opened(row, sc)
+        if r + 1 == sr and below is not None:
+            below = opened(below, sc)
+        if r == er and row[ec]:
+            return None                          # end is a wall
+
+        # Squares of this row that matter: those below a gate (entries), those above an empty square (the next
+        # gates), and start or end. Others are only ever passed through along their run.
+        above = {c: idx for idx, c in enumerate(gates)}
+        cols = [c for c in range(reader.nc) if not row[c] and
+                (c in above or (below is not None and not below[c]) or (r, c) in ((sr, sc), (er, ec)))]
+        run = [row.rfind(1, 0, c) for c in cols]          # same last wall before them when in the same run
+        old_t = len(gates)                       # position of first terminal in D
+        nb = len(cols)
+        k = nb + len(terminals)
+
+        H = [[INFINITY] * k for _ in range(k)]
+        entries = []
+        for i, c in enumerate(cols):
+            H[i][i] = 0
+            for j in range(i + 1, nb):           # along the row without a wall in between
+                if run[j] != run[i]:
+                    break
+                H[i][j] = H[j][i] = cols[j] - c
+
+            u = above.get(c)
+            if u is not None:
+                entries.append(i)
+                for t in range(len(terminals)):
+                    H[i][nb + t] = H[nb + t][i] = D[u][old_t + t] + 1
+        for i in entries:                        # up from one entry, through rows above, and down to another
+            Du = D[above[cols[i]]]
+            Hi = H[i]
+            for j in entries:
+                d = Du[above[cols[j]]] + 2
+                if d < Hi[j]:
+                    Hi[j] = d
+        for t in range(len(terminals)):
+            for t2 in range(len(terminals)):
+                H[nb + t][nb + t2] = D[old_t + t][old_t + t2]
+
+        # Paths may alternate between moving along this row and going up through rows above, as often as needed;
+        # each change of direction is at an entry, so only those need to be tried as intermediate squares
+        for p in entries:
+            Hp = H[p]
+            for i in range(k):
+                dip = H[i][p]
+                if dip < INFINITY:
+                    H[i] = [a if a <= dip + b else dip + b for a, b in zip(H[i], Hp)]
+
+        # Start and end squares become nodes of their own when reached, so they are kept for later rows
+        for (name, (tr, tc)) in [('start', (sr, sc)), ('end', (er, ec))]:
+            if r == tr:
+                idx = cols.index(tc)
+                for i in range(len(H)):
+                    H[i].append(H[i][idx])
+                H.append(H[idx][:])
+                terminals.append(name)
+
+        # Keep only the gates to the next row, and the terminals
+        keep = [i for i, c in enumerate(cols) if below is not None and not below[c]]
+        keep.extend(range(nb, len(H)))
+        gates = [cols[i] for i in keep[:len(keep) - len(terminals)]]
+        D = [[H[i][j] for j in keep] for i in keep]
+
+    if 'start' not in terminals or 'end' not in terminals:
+        return None
+    d = D[len(gates) + terminals.index('start')][len(gates) + terminals.index('end')]
+    return None if d == INFINITY else d
+
+if __name__ == '__main__':
+    print(stream_reachable('sample.maze', pad=True), stream_distance('sample.maze', pad=True))
+    print(stream_reachable('eight.maze'), stream_distance('eight.maze'))
@@ -0,0 +1,115 @@
+"""
+Record the progress of the searches in maze.py, to be analyzed or replayed later.
+
+Pass a Trace to bfs(), dfs(), dfs_distance(), dfs_recursive() or dfs_iterative() and it records an event
+every time a square is discovered (added to the queue or stack) or visited (removed from it and explored).
+Each event is stored as (step, square, kind) in three compact arrays of 4, 4 and 1 bytes, where step counts the
+squares visited so far and the square is stored as its position in the maze grid. When no trace is passed, the searches pay only
+for checking that it is None.
+
+A Trace can be saved to a file and loaded again, and replayed into any function that accepts
+(step, square, kind), such as the visualizations in visualize_search.replay(). Saved traces are always
+little-endian, so they can be loaded on any platform.
+"""
+import struct
+import sys
+from array import array
+
+from maze import Square
+
+DISCOVER = 0
+VISIT = 1
+
+STEP_TYPE = 'I'
+CELL_TYPE = 'I'
+
+TRACE_MAGIC = b'TRC2'
+TRACE_HEADER = struct.Struct('<4sIIQBB')   # magic, rows, columns, number of events, bytes per step and per cell
+
+class Trace:
+    """Events recorded while searching a maze with nr rows and nc columns."""
+    def __init__(self, nr, nc):
+        self.nr = nr
+        self.nc = nc
+        self.step = 0
+        self.steps = array(STEP_TYPE)
+        self.cells = array(CELL_TYPE)
+        self.kinds = array('B')
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def discover(self, sq):
+        self.steps.append(self.step)
+        self.cells.append(sq.row * self.nc + sq.column)
+        self.kinds.append(DISCOVER)
+
+    def visit(self, sq):
+        self.step += 1
+        self.steps.append(self.step)
+        self.cells.append(sq.row * self.nc + sq.column)
+        self.kinds.append(VISIT)
+
+    def events(self):
+        """Generate each event as (step, square, kind)."""
+        for step, cell, kind in zip(self.steps, self.cells, self.kinds):
+            yield (step, Square(*divmod(cell, self.nc)), kind)
+
+    def replay(self, renderer):
+        """Call renderer(step, square, kind) for each event in order."""
+        for (step, sq, kind) in self.events():
+            renderer(step, sq, kind)
+
+    def frontier_sizes(self):
+        """Return array holding the number of squares discovered but not yet visited, after each visit."""
+        sizes = array('l')
+        pending = 0
+        for kind in self.kinds:
+            if kind == DISCOVER:
+                pending += 1
+            else:
+                pending -= 1
+                sizes.append(pending)
+        return sizes
+
+    def save(self, fname):
+        with open(fname, 'wb') as trace_file:
+            trace_file.write(TRACE_HEADER.pack(TRACE_MAGIC, self.nr, self.nc, len(self),
+                                               self.steps.itemsize, self.cells.itemsize))
+            for values in [self.steps, self.cells]:
+                if sys.byteorder == 'big':
+                    values = array(values.typecode, values)
+                    values.byteswap()
+                values.tofile(trace_file)
+            self.kinds.tofile(trace_file)
+
+def load_trace(fname):
+    """Load Trace saved by Trace.save()."""
+    with open(fname, 'rb') as trace_file:
+        header = trace_file.read(TRACE_HEADER.size)
+        if len(header) != TRACE_HEADER.size or header[:4] != TRACE_MAGIC:
+            raise ValueError(f'{fname}: not a trace file')
+        (_, nr, nc, count, step_size, cell_size) = TRACE_HEADER.unpack(header)
+        trace = Trace(nr, nc)
+        if (step_size, cell_size) != (trace.steps.itemsize, trace.cells.itemsize):
+            raise ValueError(f'{fname}: trace uses {step_size}-byte steps and {cell_size}-byte cells')
+        trace.steps.fromfile(trace_file, count)
+        trace.cells.fromfile(trace_file, count)
+        trace.kinds.fromfile(trace_file, count)
+    if sys.byteorder == 'big':
+        trace.steps.byteswap()
+        trace.cells.byteswap()
+    trace.step = trace.steps[-1] if count else 0
+    return trace
+
+if __name__ == '__main__':
+    from maze import Maze, bfs, dfs_distance
+
+    N = 64
+    M = Maze(N, N)
+    M.random_fast(.25, seed=32, solvable=True)
+    for search in [bfs, dfs_distance]:
+        trace = Trace(M.nr, M.nc)
+        search(M, trace=trace)
+        sizes = trace.frontier_sizes()
+        print(f'{search.__name__}: {len(trace)} events over {trace.step} steps, largest frontier {max(sizes)}')
@@ -0,0 +1,163 @@
+"""
+Reductions over very large lists -- maximum, minimum, argmax and the longest increasing sublist -- computed
+with the divide-and-conquer approach of dp.py, but in a way that scales.
+
+The list is divided into chunks, and each chunk is reduced to a small summary using built-in functions that
+loop in C. Summaries of neighboring chunks are then combined, two at a time, just as largest_value_rec() and
+largest_sublist_rec() combine the results for the left and right halves, so the total work is O(N). Because a
+summary depends only on its own chunk, the chunks can be summarized in parallel by a pool of worker processes
+by passing workers=K. This only pays off when the list is large enough that summarizing a chunk costs more
+than sending it to another process.
+
+NumPy arrays are reduced directly with vectorized NumPy operations instead (NumPy is only imported when such
+an array is passed in).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, count, islice
+from operator import ge, sub
+
+CHUNK = 1 << 16
+
+def is_numpy(A):
+    return type(A).__module__ == 'numpy'
+
+def summarize_max(A, offset):
+    """Summary (largest value, its first position) of non-empty chunk A that starts at offset."""
+    m = max(A)
+    return (m, offset + A.index(m))
+
+def combine_max(L, R):
+    return R if R[0] > L[0] else L
+
+def summarize_min(A, offset):
+    """Summary (smallest value, its first position) of non-empty chunk A that starts at offset."""
+    m = min(A)
+    return (m, offset + A.index(m))
+
+def combine_min(L, R):
+    return R if R[0] < L[0] else L
+
+def summarize_sublist(A, offset):
+    """
+    Summary of non-empty chunk A that starts at offset, as the tuple (offset, size, first value, last value,
+    start of longest increasing run, its length, length of run at start of chunk, length of run at end of chunk).
+    """
+    N = len(A)
+    breaks = list(compress(count(1), map(ge, A, islice(A, 1, None))))      # where each new run starts
+    bounds = [0] + breaks + [N]
+    lengths = list(map(sub, bounds[1:], bounds))
+    length = max(lengths)
+    best = lengths.index(length)                                             # first of the longest runs
+    return (offset, N, A[0], A[-1], offset + bounds[best], length, lengths[0], lengths[-1])
+
+def combine_sublist(L, R):
+    (L_offset, L_size, L_first, L_last, L_start, L_len, L_lo, L_hi) = L
+    (R_offset, R_size, R_first, R_last, R_start, R_len, R_lo, R_hi) = R
+
+    # Either: (a) L has the longest run; (b) R has the longest run; or (c) it starts in L and continues into R
+    start, length = L_start, L_len
+    lo, hi = L_lo, R_hi
+    if L_last < R_first:
+        if L_hi + R_lo > length:
+            start, length = R_offset - L_hi, L_hi + R_lo
+        if L_lo == L_size:
+            lo = L_size + R_lo
+        if R_hi == R_size:
+            hi = R_size + L_hi
+    if R_len > length:
+        start, length = R_start, R_len
+    return (L_offset, L_size + R_size, L_first, R_last, start, length, lo, hi)
+
+def reduce(A, summarizer, combiner, workers=None, chunk=CHUNK):
+    """
+    Return summary of non-empty list A by summarizing each chunk (in parallel if workers is given) and then
+    combining the summaries with divide and conquer.
+    """
+    bounds = [(lo, min(lo + chunk, len(A))) for lo in range(0, len(A), chunk)]
+    if workers is None or len(bounds) == 1:
+        summaries = [summarizer(A[lo:hi], lo) for (lo, hi) in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(summarizer, A[lo:hi], lo) for (lo, hi) in bounds]
+            summaries = [future.result() for future in futures]
+
+    def combine(lo, hi):
+        if lo == hi:           # Base Case: just one chunk
+            return summaries[lo]
+
+        mid = (lo + hi) // 2
+        return combiner(combine(lo, mid), combine(mid+1, hi))
+
+    return combine(0, len(summaries)-1)
+
+def maximum(A, workers=None, chunk=CHUNK):
+    """Largest value in A."""
+    if len(A) == 0:
+        raise ValueError('maximum() arg is an empty sequence')
+    if is_numpy(A):
+        return A.max()
+    return reduce(A, summarize_max, combine_max, workers, chunk)[0]
+
+def minimum(A, workers=None, chunk=CHUNK):
+    """Smallest value in A."""
+    if len(A) == 0:
+        raise ValueError('minimum() arg is an empty sequence')
+    if is_numpy(A):
+        return A.min()
+    return reduce(A, summarize_min, combine_min, workers, chunk)[0]
+
+def argmax(A, workers=None, chunk=CHUNK):
+    """Position of the first occurrence of the largest value in A."""
+    if len(A) == 0:
+        raise ValueError('argmax() arg is an empty sequence')
+    if is_numpy(A):
+        return int(A.argmax())
+    return reduce(A, summarize_max, combine_max, workers, chunk)[1]
+
+def longest_increasing_sublist(A, workers=None, chunk=CHUNK):
+    """Longest sublist of consecutive increasing values in A (the first one if there are several)."""
+    if len(A) == 0:
+        return A[:0]
+    if is_numpy(A):
+        import numpy
+
+        breaks = numpy.flatnonzero(A[1:] <= A[:-1]) + 1
+        bounds = numpy.concatenate(([0], breaks, [len(A)]))
+        best = int(numpy.diff(bounds).argmax())
+        return A[bounds[best]:bounds[best+1]]
+    (_, _, _, _, start, length, _, _) = reduce(A, summarize_sublist, combine_sublist, workers, chunk)
+    return A[start:start+length]
+
+def timing_trial():
+    """Compare reductions against the loops and recursion of dp.py on random lists of size N."""
+    import random
+    import timeit
+    import dp
+
+    for k in range(12, 23, 2):
+        N = 2 ** k
+        A = [random.random() for _ in range(N)]
+        for (name, func) in [('largest_value', dp.largest_value), ('largest_value_rec', dp.largest_value_rec),
+                             ('maximum', maximum), ('largest_sublist', dp.largest_sublist),
+                             ('longest_increasing_sublist', longest_increasing_sublist)]:
+            result = timeit.timeit(lambda: func(A), number=3) / 3
+            print(name, N, f'{result:.4f}')
+
+if __name__ == '__main__':
+    import random
+    import dp
+
+    print('Compare reductions against dp.py')
+    for _ in range(10000):
+        R = [random.randint(0, 20) for _ in range(random.randint(1, 60))]
+        chunk = random.randint(1, 8)
+        if (maximum(R, chunk=chunk) != dp.largest_value(R) or minimum(R, chunk=chunk) != min(R) or
+                argmax(R, chunk=chunk) != R.index(max(R)) or
+                longest_increasing_sublist(R, chunk=chunk) != dp.largest_sublist(R)):
+            print('BAD', R, chunk)
+
+    R = [random.random() for _ in range(1000000)]
+    if (maximum(R, workers=2) != max(R) or
+            longest_increasing_sublist(R, workers=2) != longest_increasing_sublist(R)):
+        print('BAD with workers')
+    print('DONE')
@@ -4,9 +4,24 @@ A collection of different solutions for the Subset Sum problem.
 1. subset_sum_exists() uses memoization to return True or False if a subset exists whose sum is target.
 2. subset_sum() uses memoization and returns a subset whose sum equals the target.
 3. subset_sum_results() uses a different strategy for recovering the solution that is easier to explain.
+4. SubsetSums determines every sum that can be reached at once, storing them as the bits of a single integer,
+   and can recover a subset for any of them. subset_sum_bitset() uses it to solve for a single target.
+5. subset_sum_mitm() splits the values in two halves and lists the sums of all subsets of each half in sorted
+   order, then searches both lists at once for a pair summing to target. This takes time 2^(N/2), regardless
+   of how large the values are, and also works with negative values.
+6. subset_sum_ss() is the Schroeppel-Shamir variant of meet-in-the-middle: each half is split again in two, and
+   a heap generates the sums of each half in order from its two quarters as they are needed, so it takes the
+   same time but only needs memory for 2^(N/4) sums. This makes room for around 50 values of 64 bits each.
+7. subset_sum_auto() estimates the time and memory each approach needs from the number and magnitude of the values,
+   and uses the fastest one that fits in MEMORY_LIMIT.
 """
 
+import heapq
 import itertools
+import sys
+from array import array
+from bisect import bisect_right
+from math import isqrt
 
 def brute_force(A, target):
     # Each possible subset of given size
@@ -102,6 +117,217 @@ def subset_sum_result(A, target):
             last = decisions[i]
     return answer
 
+class SubsetSums:
+    """
+    Every sum (up to limit, which defaults to the sum of all values) of a subset of the non-negative values in
+    A, as the bits set in the integer reach. Adding A[i] to the subsets found so far is a single shift: the new
+    sums are reach << A[i]. To recover a subset, the reach before each value is needed; rather than keep them
+    all, only every k-th one is stored (k is the square root of len(A)), and the others are computed again
+    from these checkpoints one block at a time.
+    """
+    def __init__(self, A, limit=None):
+        if any(a < 0 for a in A):
+            raise ValueError('SubsetSums requires non-negative values')
+        self.A = list(A)
+        self.limit = sum(self.A) if limit is None else max(limit, -1)     # any negative limit reaches nothing
+        self.mask = (1 << (self.limit + 1)) - 1
+        self.every = max(1, isqrt(len(self.A)))
+        self.checkpoints = []          # reach before A[0], A[every], A[2*every], ...
+        
+        reach = 1 & self.mask          # the empty subset sums to 0
+        for i, a in enumerate(self.A):
+            if i % self.every == 0:
+                self.checkpoints.append(reach)
+            if a <= self.limit:        # larger values can never help, and shifting by them is costly
+                reach |= (reach << a) & self.mask
+        self.reach = reach
+
+    def exists(self, target):
+        """Is there a subset whose sum is target?"""
+        return 0 <= target <= self.limit and (self.reach >> target) & 1 == 1
+
+    def sums(self):
+        """Return list of all sums (up to limit) that can be reached."""
+        bits = bin(self.reach)[:1:-1]
+        return [total for total, bit in enumerate(bits) if bit == '1']
+
+    def subset(self, target):
+        """Return values from A (in order) whose sum is target, or None if there are none."""
+        if not self.exists(target):
+            return None
+        
+        answer = []
+        hi = len(self.A)
+        for block in range(len(self.checkpoints)-1, -1, -1):
+            lo = block * self.every
+            before = [self.checkpoints[block]]         # before[j] is reach before A[lo+j]
+            for i in range(lo, hi-1):
+                reach = before[-1]
+                if self.A[i] <= self.limit:
+                    reach |= (reach << self.A[i]) & self.mask
+                before.append(reach)
+            
+            # If target can be reached without A[i], do so; otherwise A[i] must be used
+            for i in range(hi-1, lo-1, -1):
+                if not (before[i-lo] >> target) & 1:
+                    answer.append(self.A[i])
+                    target -= self.A[i]
+            hi = lo
+        answer.reverse()
+        return answer
+
+def subset_sum_bitset(A, target):
+    """Return subset of non-negative values in A whose sum is target, or None if there are none."""
+    return SubsetSums(A, target).subset(target)
+
+MERGE_CHUNK = 1 << 16
+
+def merge_shifted(keys, added):
+    """
+    Return sorted keys merged with a copy of keys that adds added to each, in the same kind of sequence. Merging
+    one chunk at a time, with the keys of the other copy that fall in its range, bounds the memory needed beyond
+    the result. The copy with the smaller values is the one split into chunks, so each chunk's range is small.
+    """
+    merged = array(keys.typecode) if isinstance(keys, array) else []
+    (low, high) = (0, added) if added >= 0 else (added, 0)
+    j = 0
+    for lo in range(0, len(keys), MERGE_CHUNK):
+        part = keys[lo:lo+MERGE_CHUNK]
+        hi = bisect_right(keys, part[-1] + low - high, j)
+        merged.extend(sorted(itertools.chain(map(low.__add__, part), map(high.__add__, keys[j:hi]))))
+        j = hi
+    merged.extend(map(high.__add__, keys[j:]))
+    return merged
+
+def sorted_subset_sums(A):
+    """
+    Return sorted sequence of (sum << N) | mask for every subset of the N values in A, where bit i of mask is
+    set when A[i] is in the subset, so sorting by these keys sorts by sum. Keeping sum and mask together in a
+    single integer lets the keys be stored in an array of 64-bit integers when they fit (otherwise in a list).
+    Each value doubles the keys by merging them with a copy that adds the value.
+    """
+    N = len(A)
+    largest = (sum(abs(a) for a in A) + 1) << N
+    keys = array('q', [0]) if largest < 2**63 else [0]
+    for i, a in enumerate(A):
+        keys = merge_shifted(keys, (a << N) + (1 << i))
+    return keys
+
+def subset_sum_mitm(A, target):
+    """Return subset of values in A (in order) whose sum is target, or None if there are none."""
+    half = len(A) // 2
+    left = sorted_subset_sums(A[:half])
+    right = sorted_subset_sums(A[half:])
+    L_bits, R_bits = half, len(A) - half
+    
+    # Move up through left and down through right: if the sum is too small, only a larger left sum can help
+    i, j = 0, len(right) - 1
+    while i < len(left) and j >= 0:
+        total = (left[i] >> L_bits) + (right[j] >> R_bits)
+        if total == target:
+            mask = (left[i] & ((1 << L_bits) - 1)) | ((right[j] & ((1 << R_bits) - 1)) << half)
+            return [a for (idx, a) in enumerate(A) if mask & (1 << idx)]
+        if total < target:
+            i += 1
+        else:
+            j -= 1
+    return None
+
+def pair_sums(first, second):
+    """
+    Generate (s + t, i, j) for s = first[i] and t = second[j] in increasing order, where first and second are
+    sorted lists of sums. The heap holds only the next pair for each i, so it never grows beyond len(first).
+    """
+    heap = [(s + second[0], i, 0) for (i, s) in enumerate(first)]      # sorted, so already a heap
+    while heap:
+        (total, i, j) = heap[0]
+        yield (total, i, j)
+        if j + 1 < len(second):
+            heapq.heapreplace(heap, (first[i] + second[j+1], i, j+1))
+        else:
+            heapq.heappop(heap)
+
+def subset_sum_ss(A, target):
+    """
+    Return subset of values in A (in order) whose sum is target, or None if there are none, searching the sums
+    of the two halves as subset_sum_mitm() does, but generating each in order from the sums of its quarters.
+    """
+    half = len(A) // 2
+    bounds = [0, half // 2, half, half + (len(A) - half) // 2, len(A)]
+    sums, masks = [], []
+    for (lo, hi) in zip(bounds, bounds[1:]):
+        bits = hi - lo
+        keys = sorted_subset_sums(A[lo:hi])
+        sums.append([k >> bits for k in keys])
+        masks.append([(k & ((1 << bits) - 1)) << lo for k in keys])
+    
+    # Left sums go up; right sums go down, generated as increasing sums of the negated quarters in reverse
+    left = pair_sums(sums[0], sums[1])
+    right = pair_sums([-s for s in reversed(sums[2])], [-s for s in reversed(sums[3])])
+    L, R = next(left), next(right)
+    while True:
+        total = L[0] - R[0]
+        if total == target:
+            mask = masks[0][L[1]] | masks[1][L[2]] | masks[2][-1-R[1]] | masks[3][-1-R[2]]
+            return [a for (idx, a) in enumerate(A) if mask & (1 << idx)]
+        if total < target:
+            L = next(left, None)
+        else:
+            R = next(right, None)
+        if L is None or R is None:
+            return None
+
+# Rough time in seconds for each step of each approach, used by subset_sum_auto()
+DP_STEP     = 1.3e-6           # each (hi, partial) problem solved by subset_sum_result()
+BITSET_STEP = 7e-11            # each bit of each shift in SubsetSums
+MITM_STEP   = 6e-7             # each sum listed or searched by subset_sum_mitm()
+SS_STEP     = 1.2e-6           # each sum generated by subset_sum_ss()
+
+# Approaches whose estimated memory, in bytes, is larger than this are not used by subset_sum_auto()
+MEMORY_LIMIT = 2 ** 30
+
+def subset_sum_method(A, target):
+    """
+    Return 'dp', 'bitset', 'mitm' or 'ss', whichever should solve this problem the fastest within MEMORY_LIMIT, given
+    the number of values and their magnitude (as well as that of target). Raise ValueError if none can.
+    """
+    negative = target < 0 or any(a < 0 for a in A)
+    if not negative:
+        A = [a for a in A if a <= target]          # larger values can never be used
+    N = len(A)
+    
+    # For each approach: (estimated time, estimated memory)
+    half = 2 ** ((N + 1) // 2)
+    key_bytes = 8 if (sum(abs(a) for a in A) + 1) << ((N + 1) // 2) < 2**63 else 48
+    quarter = 2 ** ((N + 3) // 4)
+    estimates = {'mitm': (3 * half * MITM_STEP, 3 * half * key_bytes),
+                 'ss': (2 * half * SS_STEP, 4 * quarter * 200)}
+    if not negative:                                # only meet-in-the-middle handles negative values
+        states = N * min(target + 1, 2 ** N)
+        estimates['dp'] = (states * DP_STEP, states * 100)
+        estimates['bitset'] = (N * (target + 1) * BITSET_STEP, (2 * isqrt(N) + 2) * (target // 8 + 1))
+        if N >= sys.getrecursionlimit() - 50:
+            del estimates['dp']                     # subset_sum_result() recurses once for each value
+    
+    costs = {method: time for (method, (time, memory)) in estimates.items() if memory <= MEMORY_LIMIT}
+    if not costs:
+        raise ValueError(f'subset sum of {N} values with target {target} needs too much memory')
+    return min(costs, key=costs.get)
+
+def subset_sum_auto(A, target):
+    """Return subset of values in A whose sum is target, or None if there are none, using the fastest approach."""
+    method = subset_sum_method(A, target)
+    if target >= 0 and all(a >= 0 for a in A):
+        A = [a for a in A if a <= target]          # larger values can never be used
+    if method == 'mitm':
+        return subset_sum_mitm(A, target)
+    if method == 'ss':
+        return subset_sum_ss(A, target)
+    if method == 'bitset':
+        return subset_sum_bitset(A, target)
+    answer = subset_sum_result(A, target)
+    return answer if sum(answer) == target else None
+
 if __name__ == '__main__':
     target = 46
     A = [3, 5, 7, 11, 13, 17]
@@ -117,4 +343,36 @@ if __name__ == '__main__':
         s1 = subset_sum_result(X, 130)
         if sum(s1) != 130:
             print("BAD")
-            
\ No newline at end of file
+            
+        s2 = subset_sum_bitset(X, 130)
+        if sum(s2) != 130:
+            print("BAD")
+    
+    if subset_sum_bitset([10**12, 1], 1) != [1] or subset_sum_bitset([1, 2, 3], -5) is not None:
+        print("BAD")
+    if subset_sum_auto([2**63, 1, 2, 3], 3) not in ([1, 2], [3]):
+        print("BAD")
+    for _ in range(1000):
+        Y = [random.randint(-50, 50) for _ in range(random.randint(0, 10))]
+        target = random.randint(-100, 100)
+        found = brute_force(Y, target) is not None or target == 0
+        for solve in [subset_sum_mitm, subset_sum_ss]:
+            s5 = solve(Y, target)
+            if (s5 is not None) != found or (s5 is not None and sum(s5) != target):
+                print("BAD", solve.__name__, Y, target)
+    
+    import time
+    X = [random.randint(1, 100000) for _ in range(1000)]
+    now = time.perf_counter()
+    sums = SubsetSums(X, 5000000)
+    s3 = sums.subset(4999999)
+    print(f'subset_sum_bitset found {len(s3)} values summing to {sum(s3)} in {time.perf_counter() - now:.3f}s')
+    
+    X = [random.randint(1, 2**63) for _ in range(40)]
+    target = sum(random.sample(X, 20))
+    now = time.perf_counter()
+    s4 = subset_sum_auto(X, target)
+    print(f'subset_sum_auto used {subset_sum_method(X, target)} to find {len(s4)} values summing to target in {time.perf_counter() - now:.3f}s')
+    
+    for N in [44, 46, 48, 50]:
+        print(f'subset_sum_method picks {subset_sum_method([2**63] * N, N * 2**62)} for {N} values near 2**63')
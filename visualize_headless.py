@@ -0,0 +1,205 @@
+"""
+Generate the animated GIF images of a search without Tkinter, a display, or PIL, so they can be regenerated anywhere.
+
+FrameCanvas stands in for the Tkinter canvas that visualize() stores in maze.w: the walls and paths drawn by
+make_wall(), make_path() and change_color() are drawn into an in-memory image instead. Every time the search
+calls capture(), the part of the image changed since the previous frame is appended to an animated GIF, which
+GifWriter encodes as it goes, so frames are never stored.
+
+    python visualize_headless.py
+
+regenerates the animated_bfs.gif, animated_dfs.gif and animated_dfs_recursive.gif images in the images folder.
+"""
+import os
+import struct
+
+from maze import Square
+import visualize_search
+from visualize_search import make_wall, size, offset
+
+# Colors used by visualize_search; any other color is drawn in black
+PALETTE = [
+    ('white',     (255, 255, 255)),
+    ('black',     (0, 0, 0)),
+    ('darkgray',  (169, 169, 169)),
+    ('lightblue', (173, 216, 230)),
+    ('blue',      (0, 0, 255)),
+    ('red',       (255, 0, 0)),
+    ('green',     (0, 128, 0)),
+    ('yellow',    (255, 255, 0)),
+]
+COLORS = {name: idx for idx, (name, _) in enumerate(PALETTE)}
+
+class GifWriter:
+    """Write an animated GIF using PALETTE, one frame at a time, to a binary file handle."""
+    def __init__(self, out, width, height, delay):
+        self.out = out
+        self.delay = delay             # hundredths of a second between frames
+        colors = b''.join(bytes(rgb) for (_, rgb) in PALETTE)
+        bits = (len(PALETTE) - 1).bit_length()
+        out.write(b'GIF89a')
+        out.write(struct.pack('<HHBBB', width, height, 0x80 | (bits - 1), 0, 0))
+        out.write(colors)
+        out.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00')     # loop forever
+        self.min_code_size = max(2, bits)
+
+    def frame(self, pixels, x, y, width, height):
+        """Add frame that replaces the given rectangle of the image with pixels (palette indices, row by row)."""
+        # Graphic Control Extension: keep previous frame in place, and wait 'delay' before the next one
+        self.out.write(struct.pack('<BBBBHBB', 0x21, 0xf9, 4, 1 << 2, self.delay, 0, 0))
+        self.out.write(struct.pack('<BHHHHB', 0x2c, x, y, width, height, 0))
+        self.out.write(bytes([self.min_code_size]))
+        data = lzw_encode(pixels, self.min_code_size)
+        for i in range(0, len(data), 255):
+            chunk = data[i:i+255]
+            self.out.write(bytes([len(chunk)]) + chunk)
+        self.out.write(b'\x00')
+
+    def close(self):
+        self.out.write(b'\x3b')
+
+def lzw_encode(pixels, min_code_size):
+    """Compress palette indices with the variable-length LZW coding used by GIF."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    output = bytearray()
+    bits = 0                           # pending bits, least significant first
+    count = 0                          # number of pending bits
+
+    code_size = min_code_size + 1
+    next_code = end + 1
+    table = {}                         # (code of prefix << 8 | pixel) -> code of prefix extended by pixel
+    bits |= clear << count
+    count += code_size
+
+    prefix = pixels[0]
+    for p in pixels[1:]:
+        key = (prefix << 8) | p
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+
+        bits |= prefix << count
+        count += code_size
+        if next_code < 4096:
+            table[key] = next_code
+            if next_code == (1 << code_size) and code_size < 12:
+                code_size += 1
+            next_code += 1
+        else:                          # table is full, so start again
+            bits |= clear << count
+            count += code_size
+            table = {}
+            code_size = min_code_size + 1
+            next_code = end + 1
+        prefix = p
+
+        while count >= 8:
+            output.append(bits & 0xff)
+            bits >>= 8
+            count -= 8
+
+    bits |= prefix << count
+    count += code_size
+    bits |= end << count
+    count += code_size
+    while count > 0:
+        output.append(bits & 0xff)
+        bits >>= 8
+        count -= 8
+    return bytes(output)
+
+class FrameCanvas:
+    """
+    Stands in for tkinter.Canvas, supporting the create_rectangle() and itemconfig() calls made by visualize_search.
+    Rectangles are drawn (with a black outline, as Tkinter does) into an image of palette indices, and snapshot()
+    (called by capture()) sends the area changed since the last frame to the GifWriter.
+    """
+    def __init__(self, width, height, writer=None):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height)      # all white
+        self.items = []                              # bounds of each rectangle
+        self.writer = writer
+        self.frames = 0
+        self.dirty = (0, 0, width, height)
+
+    def create_rectangle(self, x0, y0, x1, y1, fill='black'):
+        self.items.append((x0, y0, x1, y1))
+        self.draw(len(self.items), fill)
+        return len(self.items)
+
+    def itemconfig(self, item, fill='black'):
+        self.draw(item, fill)
+
+    def update(self):
+        pass
+
+    def draw(self, item, fill):
+        """Draw rectangle of item (numbered from 1) with fill color, outlined in black."""
+        (x0, y0, x1, y1) = self.items[item-1]
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.width - 1), min(y1, self.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+
+        color = COLORS.get(fill, COLORS['black'])
+        w = x1 - x0 + 1
+        edge = bytes([COLORS['black']]) * w
+        inside = bytes([COLORS['black']]) + bytes([color]) * (w - 2) + bytes([COLORS['black']]) if w > 1 else edge
+        for y in range(y0, y1 + 1):
+            row = edge if y in (y0, y1) else inside
+            self.pixels[y*self.width + x0:y*self.width + x1 + 1] = row
+
+        if self.dirty is None:
+            self.dirty = (x0, y0, x1 + 1, y1 + 1)
+        else:
+            (dx0, dy0, dx1, dy1) = self.dirty
+            self.dirty = (min(dx0, x0), min(dy0, y0), max(dx1, x1 + 1), max(dy1, y1 + 1))
+
+    def snapshot(self):
+        """Send area that changed since the last frame to the writer as a new frame."""
+        (x0, y0, x1, y1) = self.dirty if self.dirty else (0, 0, 1, 1)
+        rows = [self.pixels[y*self.width + x0:y*self.width + x1] for y in range(y0, y1)]
+        if self.writer:
+            self.writer.frame(b''.join(rows), x0, y0, x1 - x0, y1 - y0)
+        self.frames += 1
+        self.dirty = None
+
+def animate(maze, explore, fname, delay=5):
+    """
+    Run explore (a search function with the signature used by visualize(), which calls capture() after each step)
+    over maze, and store the frames it captures as an animated GIF with delay hundredths of a second between them.
+    Returns the number of frames.
+    """
+    width = maze.nc * size + offset
+    height = maze.nr * size + offset
+    with open(fname, 'wb') as out:
+        writer = GifWriter(out, width, height, delay)
+        maze.w = FrameCanvas(width, height, writer)
+        for r in range(maze.nr):
+            for c in range(maze.nc):
+                sq = Square(r, c)
+                if maze.isWall(sq):
+                    make_wall(maze, sq)
+        maze.w.snapshot()
+        explore(None, maze)
+        writer.close()
+    return maze.w.frames
+
+if __name__ == '__main__':
+    import random
+    from maze import Maze
+    from visualize_bfs import bfs
+    from visualize_dfs import dfs
+    from visualize_dfs_recursive import dfs_recursive
+
+    for (name, explore) in [('bfs', bfs), ('dfs', dfs), ('dfs_recursive', dfs_recursive)]:
+        random.seed(32)   # same maze as in visualize_bfs, visualize_dfs and visualize_dfs_recursive
+        N=16
+        M = Maze(N, N)
+        M.random(33/100)
+        fname = os.path.join('images', f'animated_{name}.gif')
+        frames = animate(M, explore, fname, int(visualize_search.delay * 100))
+        print(f'{fname}: {frames} frames')
@@ -2,12 +2,15 @@
 Generic code for executing a search algorithm over a randomly generated maze using Tkinter.
 
 Can be configured to store snapshots of progress in images/ subdirectory
+
+For large mazes, pass fps to visualize() (for example, 30). The walls are then drawn as a single image
+rather than one rectangle per wall, and changes to the colors of squares are only redrawn fps times a
+second, rather than after every change, without pausing between steps.
 """
 import time
 import os
 import functools
 import tkinter
-from PIL import ImageGrab 
 
 from maze import Square
 
@@ -21,11 +24,19 @@ delay = .050                  # Speed up or slow down tkinter visualization
 grab_images = False
 image_counter = 0           
 
+# Set by visualize(): when not None, the canvas is redrawn at most this many times a second
+frame_rate = None
+last_update = 0
+
 ## https://stackoverflow.com/questions/70576249/how-do-you-take-a-screenshot-of-a-particular-widget-in-tkinter
 def capture(wid, algorithm):
     global image_counter
     """Take screenshot of the passed widget"""
-    if grab_images:
+    if hasattr(wid, 'snapshot'):    # FrameCanvas from visualize_headless records its own frames
+        wid.snapshot()
+    elif grab_images:
+        from PIL import ImageGrab
+        
         x0 = wid.winfo_rootx()
         y0 = wid.winfo_rooty()
         x1 = x0 + wid.winfo_width()
@@ -35,13 +46,17 @@ def capture(wid, algorithm):
         path = os.path.join('images', algorithm, f'image{image_counter:03d}.png')
         image_counter += 1
         im.save(path)
-    else:
+    elif frame_rate is None:
         time.sleep(delay)
 
-def visualize(maze, explore, capture=False):
-    """Pursue the explore algorithm over the given maze. if capture is true, then images are stored in appropriate subdirectory of images/"""
-    global grab_images
+def visualize(maze, explore, capture=False, fps=None):
+    """
+    Pursue the explore algorithm over the given maze. if capture is true, then images are stored in appropriate subdirectory of images/
+    If fps is given, walls are drawn as a single image and the canvas is redrawn at most fps times a second.
+    """
+    global grab_images, frame_rate
     grab_images = capture
+    frame_rate = fps
     
     master = tkinter.Tk()
     master.title('Left press to start')
@@ -54,6 +69,11 @@ def visualize(maze, explore, capture=False):
     maze.w.pack()
     
     # Make initial maze visualization
+    if frame_rate is not None:
+        maze.walls_image = make_walls_image(maze)
+        maze.w.create_image(offset, offset, image=maze.walls_image, anchor='nw')
+        return
+
     for r in range(maze.nr):
         for c in range(maze.nc):
             sq = Square(r, c)
@@ -68,6 +88,18 @@ def make_wall(maze, sq):
     except tkinter.TclError:
         return None
     
+def make_walls_image(maze):
+    """All walls in dark gray as a single PhotoImage, drawn one run of walls at a time and scaled up to size."""
+    from maze_components import runs
+
+    invert = bytes.maketrans(b'\x00\x01', b'\x01\x00')        # runs() finds runs of empty squares
+    image = tkinter.PhotoImage(width=maze.nc, height=maze.nr)
+    nc = maze.nc
+    for r in range(maze.nr):
+        for (start, end) in zip(*runs(bytes(maze.grid[r*nc:(r+1)*nc]).translate(invert))):
+            image.put('darkgray', to=(start, r, end + 1, r + 1))
+    return image.zoom(size, size)
+
 def make_path(maze, sq, color):
     """Drawing the square for a path produces a slightly inset square inside the maze square."""
     try:
@@ -79,9 +111,34 @@ def make_path(maze, sq, color):
         return None
 
 def change_color(maze, rect, color):
-    """Change the color of an existing square."""
+    """Change the color of an existing square. With a frame rate, only redraw once the next frame is due."""
+    global last_update
     try:
         maze.w.itemconfig(rect, fill=color)
-        maze.w.update()
+        if frame_rate is None:
+            maze.w.update()
+        else:
+            now = time.perf_counter()
+            if now - last_update >= 1 / frame_rate:
+                maze.w.update()
+                last_update = now
     except tkinter.TclError:
         return
+
+def replay(trace, algorithm):
+    """
+    Return explore function (for visualize() or visualize_headless.animate()) that redraws the events recorded by
+    a maze_trace.Trace, rather than running the search again: squares are shown in lightblue when discovered
+    and in blue when visited.
+    """
+    from maze_trace import DISCOVER
+
+    def explore(event, maze):
+        rects = {}
+        for (_, sq, kind) in trace.events():
+            if kind == DISCOVER:
+                rects[sq] = make_path(maze, sq, 'lightblue')
+            else:
+                change_color(maze, rects[sq], 'blue')
+                capture(maze.w, algorithm)
+    return explore